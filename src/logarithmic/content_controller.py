@@ -282,6 +282,36 @@ class ContentController:
         """
         return self._full_content
 
+    def has_nonblank_content(self) -> bool:
+        """Check whether the content holds anything besides whitespace.
+
+        Returns:
+            True if there is non-whitespace content
+        """
+        # isspace() stops at the first visible character; strip() would copy
+        content = self._full_content
+        return bool(content) and not content.isspace()
+
+    def get_last_lines(self, num_lines: int) -> str:
+        """Get the last lines of the full unfiltered content.
+
+        Scans back from the end, so the cost depends on the size of the
+        tail rather than of the whole content.
+
+        Args:
+            num_lines: Number of lines to retrieve
+
+        Returns:
+            Text after the num_lines-th newline from the end, or all content
+        """
+        content = self._full_content
+        pos = len(content)
+        for _ in range(num_lines):
+            pos = content.rfind("\n", 0, pos)
+            if pos == -1:
+                return content
+        return content[pos + 1 :]
+
     def is_paused(self) -> bool:
         """Check if content is paused.
 
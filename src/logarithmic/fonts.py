@@ -83,6 +83,7 @@ class FontManager:
         self._michroma_id = None
         self._oxanium_id = None
         self._red_hat_mono_id = None
+        self._font_cache: dict[tuple[str, int, bool], QFont] = {}
 
         # Get platform-specific font multiplier
         self._font_multiplier = get_platform_font_multiplier()
@@ -133,6 +134,30 @@ class FontManager:
         else:
             logger.warning(f"Red Hat Mono font not found at {red_hat_path}")
 
+    def _get_font(
+        self, family: str, size: int, bold: bool, style_hint: QFont.StyleHint
+    ) -> QFont:
+        """Get a font from the cache, building it on first use.
+
+        Args:
+            family: Font family name
+            size: Font size in points (will be scaled for platform)
+            bold: Whether to make the font bold
+            style_hint: Fallback style hint for font matching
+
+        Returns:
+            Copy of the cached QFont (implicitly shared, so copying is cheap)
+        """
+        key = (family, size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = QFont(family, int(size * self._font_multiplier))
+            if bold:
+                font.setWeight(QFont.Weight.Bold)
+            font.setStyleHint(style_hint)
+            self._font_cache[key] = font
+        return QFont(font)
+
     def get_title_font(self, size: int = 13, bold: bool = False) -> QFont:
         """Get font for window titles and headers (Michroma).
 
@@ -143,12 +168,7 @@ class FontManager:
         Returns:
             QFont configured for titles
         """
-        scaled_size = int(size * self._font_multiplier)
-        font = QFont("Michroma", scaled_size)
-        if bold:
-            font.setWeight(QFont.Weight.Bold)
-        font.setStyleHint(QFont.StyleHint.SansSerif)
-        return font
+        return self._get_font("Michroma", size, bold, QFont.StyleHint.SansSerif)
 
     def get_ui_font(self, size: int = 13, bold: bool = False) -> QFont:
         """Get font for UI elements (Oxanium).
@@ -160,12 +180,7 @@ class FontManager:
         Returns:
             QFont configured for UI elements
         """
-        scaled_size = int(size * self._font_multiplier)
-        font = QFont("Oxanium", scaled_size)
-        if bold:
-            font.setWeight(QFont.Weight.Bold)
-        font.setStyleHint(QFont.StyleHint.SansSerif)
-        return font
+        return self._get_font("Oxanium", size, bold, QFont.StyleHint.SansSerif)
 
     def get_mono_font(self, size: int = 13) -> QFont:
         """Get monospace font for log content (Red Hat Mono).
@@ -176,10 +191,7 @@ class FontManager:
         Returns:
             QFont configured for monospace content
         """
-        scaled_size = int(size * self._font_multiplier)
-        font = QFont("Red Hat Mono", scaled_size)
-        font.setStyleHint(QFont.StyleHint.Monospace)
-        return font
+        return self._get_font("Red Hat Mono", size, False, QFont.StyleHint.Monospace)
 
 
 # Global instance
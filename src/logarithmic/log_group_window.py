@@ -65,7 +65,7 @@ class LogGroupWindow(QWidget):
         # Track log files in this group
         self._log_paths: list[str] = []
 
-        # Tab widgets for tabbed mode (path -> dict with 'controller')
+        # Tab widgets for tabbed mode (path -> dict with 'controller' and 'widget')
         self._tab_widgets: dict[str, dict] = {}
 
         # Combined mode controller
@@ -171,11 +171,10 @@ class LogGroupWindow(QWidget):
             del self._line_counts[path]
 
         if self._mode == "tabbed" and path in self._tab_widgets:
-            # Find and remove tab
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.tabText(i) == Path(path).name:
-                    self.tab_widget.removeTab(i)
-                    break
+            # Look up the tab by its page widget (tab titles can collide)
+            index = self.tab_widget.indexOf(self._tab_widgets[path]["widget"])
+            if index >= 0:
+                self.tab_widget.removeTab(index)
             del self._tab_widgets[path]
 
         self._update_status()
@@ -202,8 +201,8 @@ class LogGroupWindow(QWidget):
         # Add tab
         self.tab_widget.addTab(widget, filename)
 
-        # Store controller
-        self._tab_widgets[path] = {"controller": controller}
+        # Store controller and page widget
+        self._tab_widgets[path] = {"controller": controller, "widget": widget}
 
         # Restore buffered content if exists
         if path in self._log_buffers:
@@ -3,6 +3,7 @@
 import logging
 import threading
 from collections import deque
+from typing import Iterable
 from typing import Protocol
 
 from PySide6.QtCore import QObject
@@ -109,6 +110,8 @@ class LogManager(QObject):
 
     Signals:
         log_content_available: Emitted when new content is available (path, content)
+        first_content_available: Emitted once when a buffer goes from empty to
+            non-empty (path)
         log_cleared: Emitted when a log buffer is cleared (path)
         log_file_created: Emitted when a watched file is created (path)
         log_file_deleted: Emitted when a watched file is deleted (path)
@@ -116,6 +119,7 @@ class LogManager(QObject):
 
     # Qt signals for cross-thread communication
     log_content_available = Signal(str, str)  # path, content
+    first_content_available = Signal(str)  # path
     log_cleared = Signal(str)  # path
     log_file_created = Signal(str)  # path
     log_file_deleted = Signal(str)  # path
@@ -126,8 +130,13 @@ class LogManager(QObject):
         """Initialize the log manager."""
         super().__init__()
         self._buffers: dict[str, LogBuffer] = {}
-        self._subscribers: dict[str, list[LogSubscriber]] = {}
+        # Insertion-ordered dicts used as sets: O(1) membership and removal
+        self._subscribers: dict[str, dict[LogSubscriber, None]] = {}
+        # Reverse index: subscriber -> paths it is subscribed to
+        self._subscriptions: dict[LogSubscriber, set[str]] = {}
         self._lock = threading.RLock()  # Protect dict access
+        # Paths whose buffer has held content since registration or last clear
+        self._nonempty_paths: set[str] = set()
 
         # Connect signals to internal handlers
         self.log_content_available.connect(self._on_content_available)
@@ -145,7 +154,7 @@ class LogManager(QObject):
         with self._lock:
             if path not in self._buffers:
                 self._buffers[path] = LogBuffer(max_lines)
-                self._subscribers[path] = []
+                self._subscribers[path] = {}
                 logger.info(f"Registered log: {path}")
                 logger.debug(f"Buffer keys: {list(self._buffers.keys())}")
 
@@ -155,10 +164,15 @@ class LogManager(QObject):
         Args:
             path: Log file path
         """
-        if path in self._buffers:
+        with self._lock:
+            if path not in self._buffers:
+                return
             del self._buffers[path]
-            del self._subscribers[path]
-            logger.info(f"Unregistered log: {path}")
+            for subscriber in self._subscribers.pop(path):
+                self._forget_subscription(subscriber, path)
+            self._nonempty_paths.discard(path)
+
+        logger.info(f"Unregistered log: {path}")
 
     def subscribe(self, path: str, subscriber: LogSubscriber) -> None:
         """Subscribe to log events for a specific file.
@@ -169,20 +183,66 @@ class LogManager(QObject):
             path: Log file path
             subscriber: Subscriber to register
         """
-        if path not in self._subscribers:
-            logger.warning(f"Cannot subscribe to unregistered log: {path}")
-            return
+        content = None
+        with self._lock:
+            subscribers = self._subscribers.get(path)
+            if subscribers is None:
+                logger.warning(f"Cannot subscribe to unregistered log: {path}")
+                return
+
+            # Already subscribed: don't replay the buffer a second time
+            if subscriber in subscribers:
+                return
 
-        if subscriber not in self._subscribers[path]:
-            self._subscribers[path].append(subscriber)
-            logger.info(f"Added subscriber for: {path}")
+            subscribers[subscriber] = None
+            self._subscriptions.setdefault(subscriber, set()).add(path)
 
-            # Send current buffer content to new subscriber
             buffer = self._buffers.get(path)
             if buffer and len(buffer) > 0:
                 content = buffer.get_content()
-                subscriber.on_log_content(path, content)
-                logger.debug(f"Sent {len(buffer)} buffered lines to new subscriber")
+
+        logger.info(f"Added subscriber for: {path}")
+
+        # Send current buffer content to new subscriber outside the lock
+        if content is not None:
+            subscriber.on_log_content(path, content)
+            logger.debug("Sent buffered content to new subscriber")
+
+    def subscribe_many(self, paths: Iterable[str], subscriber: LogSubscriber) -> None:
+        """Subscribe to log events for several files at once.
+
+        Registration happens under a single lock acquisition; buffered content
+        is then sent to the subscriber for each newly subscribed file.
+
+        Args:
+            paths: Log file paths
+            subscriber: Subscriber to register
+        """
+        added = 0
+        replay: list[tuple[str, str]] = []
+        with self._lock:
+            subscribed = self._subscriptions.setdefault(subscriber, set())
+            for path in paths:
+                subscribers = self._subscribers.get(path)
+                if subscribers is None:
+                    logger.warning(f"Cannot subscribe to unregistered log: {path}")
+                    continue
+                if subscriber in subscribers:
+                    continue
+                subscribers[subscriber] = None
+                subscribed.add(path)
+                added += 1
+
+                buffer = self._buffers.get(path)
+                if buffer and len(buffer) > 0:
+                    replay.append((path, buffer.get_content()))
+
+        if added:
+            logger.info(f"Added subscriber for {added} logs")
+
+        # Send current buffer content outside the lock
+        for path, content in replay:
+            subscriber.on_log_content(path, content)
 
     def unsubscribe(self, path: str, subscriber: LogSubscriber) -> None:
         """Unsubscribe from log events.
@@ -191,9 +251,59 @@ class LogManager(QObject):
             path: Log file path
             subscriber: Subscriber to remove
         """
-        if path in self._subscribers and subscriber in self._subscribers[path]:
-            self._subscribers[path].remove(subscriber)
-            logger.info(f"Removed subscriber for: {path}")
+        with self._lock:
+            subscribers = self._subscribers.get(path)
+            if subscribers is None or subscriber not in subscribers:
+                return
+            del subscribers[subscriber]
+            self._forget_subscription(subscriber, path)
+
+        logger.info(f"Removed subscriber for: {path}")
+
+    def unsubscribe_many(self, pairs: Iterable[tuple[str, LogSubscriber]]) -> None:
+        """Unsubscribe several (path, subscriber) pairs at once.
+
+        Args:
+            pairs: Log file path and subscriber pairs to remove
+        """
+        removed = 0
+        with self._lock:
+            for path, subscriber in pairs:
+                subscribers = self._subscribers.get(path)
+                if subscribers is not None and subscriber in subscribers:
+                    del subscribers[subscriber]
+                    self._forget_subscription(subscriber, path)
+                    removed += 1
+
+        logger.info(f"Removed {removed} subscriptions")
+
+    def unsubscribe_subscriber(self, subscriber: LogSubscriber) -> None:
+        """Unsubscribe a subscriber from every log it is subscribed to.
+
+        Args:
+            subscriber: Subscriber to remove
+        """
+        with self._lock:
+            paths = self._subscriptions.pop(subscriber, ())
+            for path in paths:
+                del self._subscribers[path][subscriber]
+
+        logger.info(f"Removed subscriber from {len(paths)} logs")
+
+    def _forget_subscription(self, subscriber: LogSubscriber, path: str) -> None:
+        """Drop path from the reverse index entry of subscriber.
+
+        Call with the lock held.
+
+        Args:
+            subscriber: Subscriber that is no longer subscribed to path
+            path: Log file path
+        """
+        paths = self._subscriptions.get(subscriber)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self._subscriptions[subscriber]
 
     def publish_content(self, path: str, content: str) -> None:
         """Publish new log content (thread-safe via signal).
@@ -249,6 +359,7 @@ class LogManager(QObject):
         """
         if path in self._buffers:
             self._buffers[path].clear()
+            self._nonempty_paths.discard(path)
             self.log_cleared.emit(path)
 
     def clear_log(self, path: str) -> None:
@@ -259,6 +370,18 @@ class LogManager(QObject):
         """
         self.clear_buffer(path)
 
+    def has_content(self, path: str) -> bool:
+        """Check whether a log file has any buffered content.
+
+        Args:
+            path: Log file path
+
+        Returns:
+            True if the buffer holds at least one line
+        """
+        buffer = self._buffers.get(path)
+        return buffer is not None and len(buffer) > 0
+
     def get_buffer_content(self, path: str) -> str:
         """Get the current buffer content for a log file.
 
@@ -278,11 +401,16 @@ class LogManager(QObject):
             path: Log file path
             content: New content
         """
+        first_content = False
+
         # Add to buffer (with lock)
         with self._lock:
             buffer = self._buffers.get(path)
             if buffer is not None:
                 buffer.append(content)
+                if path not in self._nonempty_paths and len(buffer) > 0:
+                    self._nonempty_paths.add(path)
+                    first_content = True
                 logger.debug(
                     f"Added {len(content)} chars to buffer for {path}, buffer now has {len(buffer)} lines"
                 )
@@ -299,9 +427,12 @@ class LogManager(QObject):
                     logger.error("Dict is empty!")
 
             # Notify subscribers
-            subscribers = self._subscribers.get(
-                path, []
-            ).copy()  # Copy to avoid modification during iteration
+            subscribers = list(
+                self._subscribers.get(path, ())
+            )  # Copy to avoid modification during iteration
+
+        if first_content:
+            self.first_content_available.emit(path)
 
         logger.debug(f"Notifying {len(subscribers)} subscribers for {path}")
         for subscriber in subscribers:
@@ -317,7 +448,7 @@ class LogManager(QObject):
             path: Log file path
         """
         # Notify subscribers
-        subscribers = self._subscribers.get(path, [])
+        subscribers = list(self._subscribers.get(path, ()))
         for subscriber in subscribers:
             try:
                 subscriber.on_log_cleared(path)
@@ -332,7 +463,7 @@ class LogManager(QObject):
             reason: Reason for interruption
         """
         with self._lock:
-            subscribers = self._subscribers.get(path, []).copy()
+            subscribers = list(self._subscribers.get(path, ()))
 
         for subscriber in subscribers:
             try:
@@ -347,7 +478,7 @@ class LogManager(QObject):
             path: Log file path
         """
         with self._lock:
-            subscribers = self._subscribers.get(path, []).copy()
+            subscribers = list(self._subscribers.get(path, ()))
 
         for subscriber in subscribers:
             try:
@@ -2,9 +2,26 @@
 
 import logging
 import os
+import re
+import stat
+import time
+from collections import defaultdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from functools import partial
+from itertools import chain
+from operator import methodcaller
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 
+from PySide6.QtCore import QSize
 from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QCursor
 from PySide6.QtGui import QDragEnterEvent
 from PySide6.QtGui import QDropEvent
@@ -27,6 +44,7 @@ from PySide6.QtWidgets import QMessageBox
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtWidgets import QRadioButton
 from PySide6.QtWidgets import QSpinBox
+from PySide6.QtWidgets import QStyle
 from PySide6.QtWidgets import QTabWidget
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
@@ -37,7 +55,6 @@ from logarithmic.fonts import get_font_manager
 from logarithmic.k8s_selector_dialog import K8sSelectorDialog
 from logarithmic.log_group_window import LogGroupWindow
 from logarithmic.log_manager import LogManager
-from logarithmic.log_viewer_window import LogViewerWindow
 from logarithmic.mcp_bridge import McpBridge
 from logarithmic.mcp_server import LogarithmicMcpServer
 from logarithmic.providers import FileProvider
@@ -51,8 +68,97 @@ from logarithmic.shutdown_dialog import ShutdownDialog
 from logarithmic.version_checker import UpdateAvailableDialog
 from logarithmic.version_checker import VersionChecker
 
+if TYPE_CHECKING:
+    from logarithmic.log_viewer_window import LogViewerWindow
+
 logger = logging.getLogger(__name__)
 
+# Tracked logs restored per event-loop tick, so the UI paints between chunks
+_RESTORE_CHUNK_SIZE = 10
+
+# Matches glob wildcard characters in a path key
+_WILDCARD_RE = re.compile(r"[*?]")
+
+# Date/time and number runs replaced when suggesting a wildcard pattern
+_RE_DT_DOTTED = re.compile(r"\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}")
+_RE_DT_COMPACT = re.compile(r"\d{8}-\d{6}")
+_RE_DIGITS = re.compile(r"\d+")
+
+# Icon size for the action buttons on each log row
+_ROW_ICON_SIZE = QSize(14, 14)
+
+
+def _parent_dir_exists(path_str: str, seen: dict[str, bool] | None = None) -> bool:
+    """Check whether the directory containing a path exists.
+
+    Uses os.path directly to avoid building Path objects on hot paths.
+
+    Args:
+        path_str: File path or wildcard pattern
+        seen: Optional per-pass cache of directory results, so logs sharing a
+            directory are only checked once
+
+    Returns:
+        True if the parent directory exists
+    """
+    parent = os.path.dirname(path_str) or "."
+    if seen is None:
+        return os.path.isdir(parent)
+    exists = seen.get(parent)
+    if exists is None:
+        exists = seen[parent] = os.path.isdir(parent)
+    return exists
+
+
+@lru_cache(maxsize=1024)
+def _file_display_name(path_key: str) -> str:
+    """Get the file name shown for a log row, cached across list rebuilds.
+
+    Args:
+        path_key: File path or wildcard pattern
+
+    Returns:
+        Final path component
+    """
+    return Path(path_key).name
+
+
+@contextmanager
+def _batched_updates(list_widget: QListWidget) -> Iterator[None]:
+    """Suspend repaints and signals while a list widget is rebuilt.
+
+    Args:
+        list_widget: List widget being repopulated
+    """
+    list_widget.setUpdatesEnabled(False)
+    list_widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
+        list_widget.viewport().update()
+
+
+def _drop_path_kind(path_str: str) -> str | None:
+    """Classify a dropped path with a single stat call.
+
+    Args:
+        path_str: Local path from the drop event
+
+    Returns:
+        "file" or "folder", or None if the path is missing or unsupported
+    """
+    try:
+        mode = os.stat(path_str).st_mode
+    except OSError:
+        return None
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "folder"
+    return None
+
 
 class TrackingModeDialog(QDialog):
     """Dialog to select tracking mode for a log file or folder."""
@@ -68,6 +174,7 @@ class TrackingModeDialog(QDialog):
         super().__init__(parent)
         self.path = path
         self.is_folder = is_folder
+        self._path_obj = Path(path)
         self.tracking_mode = "wildcard" if is_folder else "dedicated"  # Default
         self.wildcard_pattern = ""
 
@@ -85,11 +192,10 @@ class TrackingModeDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Path info
-        path_obj = Path(self.path)
         if self.is_folder:
-            item_label = QLabel(f"Folder: {path_obj.name}")
+            item_label = QLabel(f"Folder: {self._path_obj.name}")
         else:
-            item_label = QLabel(f"File: {path_obj.name}")
+            item_label = QLabel(f"File: {self._path_obj.name}")
         item_label.setWordWrap(True)
         item_label.setToolTip(self.path)
         layout.addWidget(item_label)
@@ -160,16 +266,19 @@ class TrackingModeDialog(QDialog):
 
     def _on_mode_changed(self) -> None:
         """Handle tracking mode change."""
-        if self.wildcard_radio and self.wildcard_radio.isChecked():
+        want_enabled = bool(self.wildcard_radio and self.wildcard_radio.isChecked())
+        # Both radios emit toggled for a single click; act on the first only
+        if self.wildcard_input.isEnabled() == want_enabled:
+            return
+
+        if want_enabled:
             self.wildcard_input.setEnabled(True)
             # Pre-fill with filename as template
-            filename = Path(self.path).name
+            filename = self._path_obj.name
             # Replace date/time patterns with wildcards
-            import re
-
-            pattern = re.sub(r"\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}", "*", filename)
-            pattern = re.sub(r"\d{8}-\d{6}", "*", pattern)
-            pattern = re.sub(r"\d+", "*", pattern)
+            pattern = _RE_DT_DOTTED.sub("*", filename)
+            pattern = _RE_DT_COMPACT.sub("*", pattern)
+            pattern = _RE_DIGITS.sub("*", pattern)
             self.wildcard_input.setText(pattern)
             self.wildcard_input.setFocus()
             self.wildcard_input.selectAll()
@@ -187,7 +296,7 @@ class TrackingModeDialog(QDialog):
                 )
                 return
 
-            if "*" not in pattern and "?" not in pattern:
+            if _WILDCARD_RE.search(pattern) is None:
                 QMessageBox.warning(
                     self,
                     "Invalid Pattern",
@@ -198,9 +307,9 @@ class TrackingModeDialog(QDialog):
             self.tracking_mode = "wildcard"
             # Build full pattern with directory
             if self.is_folder:
-                folder_dir = Path(self.path)
+                folder_dir = self._path_obj
             else:
-                folder_dir = Path(self.path).parent
+                folder_dir = self._path_obj.parent
             self.wildcard_pattern = str(folder_dir / pattern)
         else:
             self.tracking_mode = "dedicated"
@@ -222,6 +331,14 @@ class MainWindow(QMainWindow):
         # Load custom fonts
         self._fonts = get_font_manager()
 
+        # Row button icons, rendered once and shared by every log row
+        style = self.style()
+        self._icon_assign = style.standardIcon(QStyle.StandardPixmap.SP_ArrowRight)
+        self._icon_refresh = style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
+        self._icon_close = style.standardIcon(
+            QStyle.StandardPixmap.SP_DialogCloseButton
+        )
+
         # Central log manager
         self._log_manager = LogManager()
 
@@ -230,16 +347,53 @@ class MainWindow(QMainWindow):
 
         # Track active providers and viewer windows
         self._providers: dict[str, LogProvider] = {}
-        self._viewer_windows: dict[str, LogViewerWindow] = {}
+        self._viewer_windows: dict[str, "LogViewerWindow"] = {}
+        self._viewer_list: list["LogViewerWindow"] = []  # Open viewers, in open order
         self._group_windows: dict[str, LogGroupWindow] = {}  # group_name -> window
         self._log_groups: dict[str, str] = {}  # path_key -> group_name
-        self._available_groups: list[str] = []  # List of group names
+        # Reverse of _log_groups: group_name -> path_keys in assignment order
+        self._group_to_logs: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._available_groups: dict[str, None] = {}  # Group names, in order
+        # Group dropdown entries shared by every log row; synced on group changes
+        self._group_combo_items: list[str] = ["(no group)"]
+        # Group name -> its row in the groups list
+        self._group_items: dict[str, QListWidgetItem] = {}
+        # Path key -> its row in the log list
+        self._log_items: dict[str, QListWidgetItem] = {}
 
         # Track provider configs for session persistence
         self._provider_configs: dict[str, ProviderConfig] = {}  # path_key -> config
 
         # Track which windows should auto-open after content loads
         self._pending_window_opens: set[str] = set()
+        # Pending windows whose content has arrived, opened together in one pass
+        self._ready_to_open: set[str] = set()
+        self._auto_open_flush_scheduled = False
+
+        # Tracked logs still to restore, drained a chunk at a time
+        self._restore_queue: deque[str] = deque()
+        self._restore_checked_dirs: dict[str, bool] = {}
+        self._restore_scheduled = False
+        self._restore_on_complete: Callable[[], None] | None = None
+
+        # Coalesce open-window list and group writes from rapid changes
+        self._save_open_pending = False
+        self._save_groups_pending = False
+        # Group name list changed since the last write (not just assignments)
+        self._save_group_names_pending = False
+
+        # Font size clicks update the labels at once; the rest waits for a pause
+        self._pending_font_sizes: dict[str, int] = {}
+        self._font_debounce = QTimer(self)
+        self._font_debounce.setSingleShot(True)
+        self._font_debounce.setInterval(50)
+        self._font_debounce.timeout.connect(self._apply_pending_font_sizes)
+        # Applied sizes are written to the session once clicking settles
+        self._unsaved_font_sizes: dict[str, int] = {}
+        self._font_save_timer = QTimer(self)
+        self._font_save_timer.setSingleShot(True)
+        self._font_save_timer.setInterval(300)
+        self._font_save_timer.timeout.connect(self._save_font_sizes)
 
         # Settings manager
         self._settings = Settings()
@@ -253,9 +407,14 @@ class MainWindow(QMainWindow):
 
         # Track main window position changes
         self._last_main_position: tuple[int, int, int, int] | None = None
-
-        # Connect to log manager signals for auto-opening windows
-        self._log_manager.log_content_available.connect(
+        # Moves and resizes arrive per pixel while dragging; save once it settles
+        self._main_position_timer = QTimer(self)
+        self._main_position_timer.setSingleShot(True)
+        self._main_position_timer.setInterval(250)
+        self._main_position_timer.timeout.connect(self._flush_main_window_position)
+
+        # Auto-open windows once a restored log first has content
+        self._log_manager.first_content_available.connect(
             self._on_content_available_for_auto_open
         )
 
@@ -263,12 +422,18 @@ class MainWindow(QMainWindow):
         self._version_checker: VersionChecker | None = None
 
         self._setup_ui()
-        self._restore_session()
-        self._initialize_mcp_server()
         self._restore_main_window_position()
         self._load_font_sizes()
         self._check_for_updates()
 
+        # Start providers after the first paint so the window appears at once
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self) -> None:
+        """Restore the session and start the MCP server once the UI is shown."""
+        # MCP bridge subscribes to the logs registered by the session restore
+        self._restore_session(on_complete=self._initialize_mcp_server)
+
     def _setup_ui(self) -> None:
         """Set up the user interface."""
         self.setWindowTitle("Logarithmic - Log Tracker")
@@ -486,7 +651,7 @@ class MainWindow(QMainWindow):
         self.log_font_size_down = QPushButton("▼")
         self.log_font_size_down.setFont(self._fonts.get_ui_font(10))
         self.log_font_size_down.setFixedWidth(40)
-        self.log_font_size_down.clicked.connect(lambda: self._change_log_font_size(-1))
+        self.log_font_size_down.clicked.connect(partial(self._change_log_font_size, -1))
         log_font_layout.addWidget(self.log_font_size_down)
         self._ui_elements.append(self.log_font_size_down)
 
@@ -494,7 +659,7 @@ class MainWindow(QMainWindow):
         self.log_font_size_up = QPushButton("▲")
         self.log_font_size_up.setFont(self._fonts.get_ui_font(10))
         self.log_font_size_up.setFixedWidth(40)
-        self.log_font_size_up.clicked.connect(lambda: self._change_log_font_size(1))
+        self.log_font_size_up.clicked.connect(partial(self._change_log_font_size, 1))
         log_font_layout.addWidget(self.log_font_size_up)
         self._ui_elements.append(self.log_font_size_up)
 
@@ -523,7 +688,7 @@ class MainWindow(QMainWindow):
         self.ui_font_size_down = QPushButton("▼")
         self.ui_font_size_down.setFont(self._fonts.get_ui_font(10))
         self.ui_font_size_down.setFixedWidth(40)
-        self.ui_font_size_down.clicked.connect(lambda: self._change_ui_font_size(-1))
+        self.ui_font_size_down.clicked.connect(partial(self._change_ui_font_size, -1))
         ui_font_layout.addWidget(self.ui_font_size_down)
         self._ui_elements.append(self.ui_font_size_down)
 
@@ -531,7 +696,7 @@ class MainWindow(QMainWindow):
         self.ui_font_size_up = QPushButton("▲")
         self.ui_font_size_up.setFont(self._fonts.get_ui_font(10))
         self.ui_font_size_up.setFixedWidth(40)
-        self.ui_font_size_up.clicked.connect(lambda: self._change_ui_font_size(1))
+        self.ui_font_size_up.clicked.connect(partial(self._change_ui_font_size, 1))
         ui_font_layout.addWidget(self.ui_font_size_up)
         self._ui_elements.append(self.ui_font_size_up)
 
@@ -561,7 +726,7 @@ class MainWindow(QMainWindow):
         self.status_font_size_down.setFont(self._fonts.get_ui_font(10))
         self.status_font_size_down.setFixedWidth(40)
         self.status_font_size_down.clicked.connect(
-            lambda: self._change_status_font_size(-1)
+            partial(self._change_status_font_size, -1)
         )
         status_font_layout.addWidget(self.status_font_size_down)
         self._ui_elements.append(self.status_font_size_down)
@@ -571,7 +736,7 @@ class MainWindow(QMainWindow):
         self.status_font_size_up.setFont(self._fonts.get_ui_font(10))
         self.status_font_size_up.setFixedWidth(40)
         self.status_font_size_up.clicked.connect(
-            lambda: self._change_status_font_size(1)
+            partial(self._change_status_font_size, 1)
         )
         status_font_layout.addWidget(self.status_font_size_up)
         self._ui_elements.append(self.status_font_size_up)
@@ -767,10 +932,9 @@ class MainWindow(QMainWindow):
             self.provider_combo.addItem(f"{icon} {display_name}", provider_type)
 
         # Default to File provider
-        for i in range(self.provider_combo.count()):
-            if self.provider_combo.itemData(i) == ProviderType.FILE.value:
-                self.provider_combo.setCurrentIndex(i)
-                break
+        index = self.provider_combo.findData(ProviderType.FILE.value)
+        if index >= 0:
+            self.provider_combo.setCurrentIndex(index)
 
     def _on_provider_type_changed(self, index: int) -> None:
         """Handle provider type selection change.
@@ -847,15 +1011,14 @@ class MainWindow(QMainWindow):
             path_key: Full path or pattern
             is_wildcard: Whether this is a wildcard pattern
         """
-        # Get current UI font size from settings
-        font_sizes = self._settings.get_font_sizes()
-        ui_size = font_sizes.get("ui_elements", 10)
+        ui_size = self._ui_font_size
 
         # Create list item
         item = QListWidgetItem(self.log_list)
 
-        # Create custom widget for the item
+        # Create custom widget for the item; child widgets inherit its font
         widget = QWidget()
+        widget.setFont(self._fonts.get_ui_font(ui_size))
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 2, 5, 2)
 
@@ -874,7 +1037,7 @@ class MainWindow(QMainWindow):
             display_name = path_key.replace("k8s://", "")
         else:
             # For files, show just filename
-            display_name = Path(path_key).name
+            display_name = _file_display_name(path_key)
 
         # Add wildcard indicator if applicable
         if is_wildcard:
@@ -883,17 +1046,12 @@ class MainWindow(QMainWindow):
             display_name = f"{provider_icon} {display_name}"
 
         name_label = QLabel(display_name)
-        name_label.setFont(self._fonts.get_ui_font(ui_size))
-        name_label.setToolTip(path_key)  # Show full path on hover
         layout.addWidget(name_label)
 
         # Group selector
         group_combo = QComboBox()
-        group_combo.setFont(self._fonts.get_ui_font(ui_size))
         group_combo.setMaximumWidth(120)
-        group_combo.addItem("(no group)")
-        for group_name in self._available_groups:
-            group_combo.addItem(group_name)
+        group_combo.addItems(self._group_combo_items)
 
         # Set current group if assigned
         current_group = self._log_groups.get(path_key)
@@ -905,38 +1063,58 @@ class MainWindow(QMainWindow):
         layout.addWidget(group_combo)
 
         # Add to group button
-        add_to_group_btn = QPushButton("→")
-        add_to_group_btn.setFont(self._fonts.get_ui_font(ui_size))
+        add_to_group_btn = QPushButton()
+        add_to_group_btn.setIcon(self._icon_assign)
+        add_to_group_btn.setIconSize(_ROW_ICON_SIZE)
         add_to_group_btn.setToolTip("Add to selected group")
         add_to_group_btn.setMaximumWidth(30)
-        add_to_group_btn.clicked.connect(
-            lambda: self._on_assign_to_group(path_key, group_combo.currentText())
-        )
+        add_to_group_btn.setProperty("path_key", path_key)
+        add_to_group_btn.clicked.connect(self._on_assign_clicked)
         layout.addWidget(add_to_group_btn)
 
         layout.addStretch()
 
         # Refresh button
-        refresh_btn = QPushButton("🔄")
-        refresh_btn.setFont(self._fonts.get_ui_font(ui_size))
+        refresh_btn = QPushButton()
+        refresh_btn.setIcon(self._icon_refresh)
+        refresh_btn.setIconSize(_ROW_ICON_SIZE)
         refresh_btn.setToolTip("Refresh log (clear and restart)")
         refresh_btn.setMaximumWidth(30)
-        refresh_btn.clicked.connect(lambda: self._on_refresh_log(path_key))
+        refresh_btn.setProperty("path_key", path_key)
+        refresh_btn.clicked.connect(self._on_refresh_clicked)
         layout.addWidget(refresh_btn)
 
         # Unregister/Close button
-        close_btn = QPushButton("✖")
-        close_btn.setFont(self._fonts.get_ui_font(ui_size))
+        close_btn = QPushButton()
+        close_btn.setIcon(self._icon_close)
+        close_btn.setIconSize(_ROW_ICON_SIZE)
         close_btn.setToolTip("Unregister and close log")
         close_btn.setMaximumWidth(30)
-        close_btn.clicked.connect(lambda: self._on_unregister_log(path_key))
+        close_btn.setProperty("path_key", path_key)
+        close_btn.clicked.connect(self._on_unregister_clicked)
         layout.addWidget(close_btn)
 
         # Set the custom widget
         item.setSizeHint(widget.sizeHint())
         item.setData(Qt.ItemDataRole.UserRole, path_key)  # Store full path in item data
+        item.setToolTip(path_key)  # Show full path on hover
         self.log_list.addItem(item)
         self.log_list.setItemWidget(item, widget)
+        self._log_items[path_key] = item
+
+    def _on_assign_clicked(self) -> None:
+        """Assign the clicked row's log to the group selected in that row."""
+        button = self.sender()
+        group_combo = button.parent().findChild(QComboBox)
+        self._on_assign_to_group(button.property("path_key"), group_combo.currentText())
+
+    def _on_refresh_clicked(self) -> None:
+        """Refresh the clicked row's log."""
+        self._on_refresh_log(self.sender().property("path_key"))
+
+    def _on_unregister_clicked(self) -> None:
+        """Unregister the clicked row's log."""
+        self._on_unregister_log(self.sender().property("path_key"))
 
     def _add_kubernetes_log(self, input_str: str) -> None:
         """Add a Kubernetes pod log source.
@@ -1018,9 +1196,7 @@ class MainWindow(QMainWindow):
             provider = self._provider_registry.create_provider(
                 config, self._log_manager, path_key
             )
-            provider.error_occurred.connect(
-                lambda err: self._on_watcher_error(path_key, err)
-            )
+            provider.error_occurred.connect(partial(self._on_watcher_error, path_key))
             provider.start()
 
             self._providers[path_key] = provider
@@ -1066,7 +1242,7 @@ class MainWindow(QMainWindow):
         if path_key in self._providers:
             # New provider-based system
             provider = self._providers[path_key]
-            provider.stop()
+            self._stop_providers([provider])
 
             # Recreate provider from config
             config = self._provider_configs.get(path_key)
@@ -1075,7 +1251,7 @@ class MainWindow(QMainWindow):
                     config, self._log_manager, path_key
                 )
                 new_provider.error_occurred.connect(
-                    lambda err: self._on_watcher_error(path_key, err)
+                    partial(self._on_watcher_error, path_key)
                 )
                 new_provider.start()
                 self._providers[path_key] = new_provider
@@ -1099,9 +1275,10 @@ class MainWindow(QMainWindow):
             )
             return
 
-        self._available_groups.append(group_name)
+        self._available_groups[group_name] = None
+        self._sync_group_combo_items()
         self._add_group_to_list(group_name)
-        self._refresh_all_log_items()
+        self._update_log_group_combos(added=group_name)
         self._save_groups()
         logger.info(f"Added group: {group_name}")
 
@@ -1111,13 +1288,13 @@ class MainWindow(QMainWindow):
         Args:
             group_name: Name of the group
         """
-        # Get current UI font size from settings
-        font_sizes = self._settings.get_font_sizes()
-        ui_size = font_sizes.get("ui_elements", 10)
+        ui_size = self._ui_font_size
 
         item = QListWidgetItem(self.groups_list)
 
+        # Child widgets inherit the row font
         widget = QWidget()
+        widget.setFont(self._fonts.get_ui_font(ui_size))
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 2, 5, 2)
 
@@ -1129,23 +1306,32 @@ class MainWindow(QMainWindow):
 
         # Show/Hide button
         show_btn = QPushButton("Show")
-        show_btn.setFont(self._fonts.get_ui_font(ui_size))
         show_btn.setMaximumWidth(50)
-        show_btn.clicked.connect(lambda: self._on_show_group(group_name))
+        show_btn.setProperty("group_name", group_name)
+        show_btn.clicked.connect(self._on_show_group_clicked)
         layout.addWidget(show_btn)
 
         # Remove button
         remove_btn = QPushButton("✖")
-        remove_btn.setFont(self._fonts.get_ui_font(ui_size))
         remove_btn.setToolTip("Remove group")
         remove_btn.setMaximumWidth(30)
-        remove_btn.clicked.connect(lambda: self._on_remove_group(group_name))
+        remove_btn.setProperty("group_name", group_name)
+        remove_btn.clicked.connect(self._on_remove_group_clicked)
         layout.addWidget(remove_btn)
 
         item.setSizeHint(widget.sizeHint())
         item.setData(Qt.ItemDataRole.UserRole, group_name)
         self.groups_list.addItem(item)
         self.groups_list.setItemWidget(item, widget)
+        self._group_items[group_name] = item
+
+    def _on_show_group_clicked(self) -> None:
+        """Show the clicked row's group window."""
+        self._on_show_group(self.sender().property("group_name"))
+
+    def _on_remove_group_clicked(self) -> None:
+        """Remove the clicked row's group."""
+        self._on_remove_group(self.sender().property("group_name"))
 
     def _on_remove_group(self, group_name: str) -> None:
         """Handle removing a group.
@@ -1154,9 +1340,7 @@ class MainWindow(QMainWindow):
             group_name: Name of the group to remove
         """
         # Check if any logs are assigned to this group
-        assigned_logs = [
-            path for path, group in self._log_groups.items() if group == group_name
-        ]
+        assigned_logs = list(self._group_to_logs.get(group_name, ()))
 
         if assigned_logs:
             reply = QMessageBox.question(
@@ -1179,16 +1363,15 @@ class MainWindow(QMainWindow):
             del self._group_windows[group_name]
 
         # Remove from available groups
-        self._available_groups.remove(group_name)
+        del self._available_groups[group_name]
+        self._sync_group_combo_items()
 
         # Remove from list
-        for i in range(self.groups_list.count()):
-            item = self.groups_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == group_name:
-                self.groups_list.takeItem(i)
-                break
+        item = self._group_items.pop(group_name, None)
+        if item is not None:
+            self.groups_list.takeItem(self.groups_list.row(item))
 
-        self._refresh_all_log_items()
+        self._update_log_group_combos(removed=group_name)
         self._save_groups()
         logger.info(f"Removed group: {group_name}")
 
@@ -1247,7 +1430,9 @@ class MainWindow(QMainWindow):
             group_name, theme_colors=theme_colors, initial_mode=initial_mode
         )
         group_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        group_window.destroyed.connect(lambda: self._on_group_window_closed(group_name))
+        group_window.destroyed.connect(
+            partial(self._on_group_window_closed, group_name)
+        )
 
         # Set callbacks
         group_window.set_position_changed_callback(
@@ -1258,8 +1443,8 @@ class MainWindow(QMainWindow):
         )
         group_window.set_other_windows_callback(
             lambda: (
-                list(self._viewer_windows.values())
-                + [gw for gw in self._group_windows.values() if gw != group_window]
+                self._viewer_list
+                + [gw for gw in self._group_windows.values() if gw is not group_window]
             )
         )
         group_window.set_mode_changed_callback(
@@ -1278,16 +1463,15 @@ class MainWindow(QMainWindow):
             group_window.resize(default_width, default_height)
 
         # Apply font sizes
-        font_sizes = self._settings.get_font_sizes()
-        group_window.set_log_font_size(font_sizes.get("log_content", 9))
-        group_window.set_ui_font_size(font_sizes.get("ui_elements", 10))
-        group_window.set_status_font_size(font_sizes.get("status_bar", 9))
+        group_window.set_log_font_size(self._log_font_size)
+        group_window.set_ui_font_size(self._ui_font_size)
+        group_window.set_status_font_size(self._status_font_size)
 
-        # Add all logs assigned to this group
-        for path, group in self._log_groups.items():
-            if group == group_name:
-                group_window.add_log(path)
-                self._log_manager.subscribe(path, group_window)
+        # Add all logs assigned to this group, then subscribe in one batch
+        paths = list(self._group_to_logs.get(group_name, ()))
+        for path in paths:
+            group_window.add_log(path)
+        self._log_manager.subscribe_many(paths, group_window)
 
         # Initialize to saved mode (combined by default) after logs are added
         group_window.initialize_mode()
@@ -1297,33 +1481,66 @@ class MainWindow(QMainWindow):
         logger.info(f"Created group window: {group_name}")
 
     def _refresh_all_log_items(self) -> None:
-        """Refresh all log list items to update group dropdowns."""
-        # Store current items
-        items_data = []
-        for i in range(self.log_list.count()):
-            item = self.log_list.item(i)
-            path_key = item.data(Qt.ItemDataRole.UserRole)
-            items_data.append(path_key)
-
-        # Clear and recreate
-        self.log_list.clear()
-        for path_key in items_data:
-            is_wildcard = "*" in path_key or "?" in path_key
-            self._add_log_to_list(path_key, is_wildcard)
+        """Refresh all log list rows in place to update group dropdowns and fonts."""
+        ui_size = self._ui_font_size
+        font = self._fonts.get_ui_font(ui_size)
+        group_names = self._group_combo_items
+        group_index = {name: i for i, name in enumerate(group_names)}
+
+        # Update existing row widgets with a single repaint at the end
+        with _batched_updates(self.log_list):
+            for path_key, item in self._log_items.items():
+                widget = self.log_list.itemWidget(item)
+                widget.setFont(font)
+
+                group_combo = widget.findChild(QComboBox)
+                group_combo.clear()
+                group_combo.addItems(group_names)
+                current_group = self._log_groups.get(path_key)
+                group_combo.setCurrentIndex(group_index.get(current_group, 0))
+
+                item.setSizeHint(widget.sizeHint())
+
+    def _sync_group_combo_items(self) -> None:
+        """Rebuild the shared group dropdown entries after groups change."""
+        self._group_combo_items = ["(no group)", *self._available_groups]
+
+    def _update_log_group_combos(
+        self, added: str | None = None, removed: str | None = None
+    ) -> None:
+        """Add or remove one group in every log row's group dropdown.
+
+        Args:
+            added: Group name to append, if any
+            removed: Group name to drop, if any
+        """
+        for item in self._log_items.values():
+            widget = self.log_list.itemWidget(item)
+            group_combo = widget.findChild(QComboBox)
+            if added is not None:
+                group_combo.addItem(added)
+            if removed is not None:
+                index = group_combo.findText(removed)
+                if index >= 0:
+                    # Fall back to "(no group)" if the removed group was shown
+                    was_current = group_combo.currentIndex() == index
+                    group_combo.removeItem(index)
+                    if was_current:
+                        group_combo.setCurrentIndex(0)
 
     def _refresh_all_group_items(self) -> None:
-        """Refresh all group list items to update fonts."""
-        # Store current items
-        items_data = []
-        for i in range(self.groups_list.count()):
-            item = self.groups_list.item(i)
-            group_name = item.data(Qt.ItemDataRole.UserRole)
-            items_data.append(group_name)
-
-        # Clear and recreate
-        self.groups_list.clear()
-        for group_name in items_data:
-            self._add_group_to_list(group_name)
+        """Refresh all group list rows in place to update fonts."""
+        ui_size = self._ui_font_size
+        font = self._fonts.get_ui_font(ui_size)
+        bold_font = self._fonts.get_ui_font(ui_size, bold=True)
+
+        # Update existing row widgets with a single repaint at the end
+        with _batched_updates(self.groups_list):
+            for item in self._group_items.values():
+                widget = self.groups_list.itemWidget(item)
+                widget.setFont(font)
+                widget.findChild(QLabel).setFont(bold_font)
+                item.setSizeHint(widget.sizeHint())
 
     def _on_assign_to_group(self, path_key: str, group_selection: str) -> None:
         """Handle assigning a log to a group.
@@ -1360,17 +1577,18 @@ class MainWindow(QMainWindow):
         # Close individual viewer window if open
         if path_key in self._viewer_windows:
             self._viewer_windows[path_key].close()
-            del self._viewer_windows[path_key]
+            self._forget_viewer(path_key)
 
         # Update assignment
         self._log_groups[path_key] = group_name
+        self._group_to_logs[group_name][path_key] = None
 
         # Add to group window if it exists
         if group_name in self._group_windows:
             self._group_windows[group_name].add_log(path_key)
             self._log_manager.subscribe(path_key, self._group_windows[group_name])
 
-        self._save_groups()
+        self._save_groups(names_changed=False)
 
     def _unassign_from_group(self, path_key: str) -> None:
         """Unassign a log from its group.
@@ -1391,7 +1609,12 @@ class MainWindow(QMainWindow):
 
         # Remove assignment
         del self._log_groups[path_key]
-        self._save_groups()
+        members = self._group_to_logs.get(group_name)
+        if members is not None:
+            members.pop(path_key, None)
+            if not members:
+                del self._group_to_logs[group_name]
+        self._save_groups(names_changed=False)
 
     def _on_viewer_window_closed(self, path_key: str) -> None:
         """Handle viewer window being closed.
@@ -1399,13 +1622,14 @@ class MainWindow(QMainWindow):
         Args:
             path_key: Path key identifying the log file
         """
-        if path_key in self._viewer_windows:
-            # Unsubscribe from log manager
-            viewer = self._viewer_windows[path_key]
-            self._log_manager.unsubscribe(path_key, viewer)
-            del self._viewer_windows[path_key]
-            logger.info(f"Viewer window closed and unsubscribed: {path_key}")
-            self._save_open_windows()
+        viewer = self._forget_viewer(path_key)
+        if viewer is None:
+            return
+
+        # Unsubscribe from log manager
+        self._log_manager.unsubscribe(path_key, viewer)
+        logger.info("Viewer window closed and unsubscribed: %s", path_key)
+        self._save_open_windows()
 
     def _on_group_window_closed(self, group_name: str) -> None:
         """Handle group window being closed.
@@ -1428,7 +1652,7 @@ class MainWindow(QMainWindow):
         # Stop provider or watcher
         if path_key in self._providers:
             provider = self._providers[path_key]
-            provider.stop()
+            self._stop_providers([provider])
             del self._providers[path_key]
             if path_key in self._provider_configs:
                 del self._provider_configs[path_key]
@@ -1451,11 +1675,9 @@ class MainWindow(QMainWindow):
         self._settings.remove_provider_config(path_key)  # Clean up provider config
 
         # Remove from list
-        for i in range(self.log_list.count()):
-            item = self.log_list.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole) == path_key:
-                self.log_list.takeItem(i)
-                break
+        item = self._log_items.pop(path_key, None)
+        if item is not None:
+            self.log_list.takeItem(self.log_list.row(item))
 
         logger.info(f"Unregistered log: {path_key}")
 
@@ -1467,15 +1689,17 @@ class MainWindow(QMainWindow):
             restore_position: Whether to restore saved window position
         """
         # Check if log is in a group - if so, show group window instead
-        if path_key in self._log_groups:
-            group_name = self._log_groups[path_key]
+        group_name = self._log_groups.get(path_key)
+        if group_name is not None:
             logger.info(
-                f"Log {path_key} is in group {group_name}, showing group window instead"
+                "Log %s is in group %s, showing group window instead",
+                path_key,
+                group_name,
             )
             self._on_show_group(group_name)
             return
 
-        logger.info(f"Opening log viewer for: {path_key}")
+        logger.info("Opening log viewer for: %s", path_key)
 
         # Check if window already exists
         if path_key in self._viewer_windows:
@@ -1484,14 +1708,17 @@ class MainWindow(QMainWindow):
             window.activateWindow()
             # Flash the window to get user's attention
             window.flash_window()
-            logger.info(f"Flashed existing window for: {path_key}")
+            logger.info("Flashed existing window for: %s", path_key)
             return
 
+        # Viewer module is only needed once the user opens a window
+        from logarithmic.log_viewer_window import LogViewerWindow
+
         # Create new viewer window
         theme_colors = self._settings.get_theme_colors()
         viewer = LogViewerWindow(path_key, theme_colors=theme_colors)
         viewer.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        viewer.destroyed.connect(lambda: self._on_viewer_window_closed(path_key))
+        viewer.destroyed.connect(partial(self._on_viewer_window_closed, path_key))
 
         # Connect provider pause/resume to content controller pause callback
         if path_key in self._providers:
@@ -1506,7 +1733,7 @@ class MainWindow(QMainWindow):
             if pos:
                 viewer.move(pos["x"], pos["y"])
                 viewer.resize(pos["width"], pos["height"])
-                logger.info(f"Restored window position for: {path_key}")
+                logger.info("Restored window position for: %s", path_key)
 
         # Set callbacks
         viewer.set_position_changed_callback(
@@ -1515,9 +1742,7 @@ class MainWindow(QMainWindow):
         viewer.set_default_size_callback(
             lambda w, h: self._settings.set_default_window_size(w, h)
         )
-        viewer.set_other_windows_callback(
-            lambda: [v for v in self._viewer_windows.values() if v != viewer]
-        )
+        viewer.set_other_windows_callback(lambda: self._other_viewers(viewer))
 
         # Apply default size if not restoring position
         if not restore_position:
@@ -1525,36 +1750,97 @@ class MainWindow(QMainWindow):
             viewer.resize(default_width, default_height)
 
         # Apply font sizes
-        font_sizes = self._settings.get_font_sizes()
-        viewer.set_log_font_size(font_sizes.get("log_content", 9))
-        viewer.set_ui_font_size(font_sizes.get("ui_elements", 10))
-        viewer.set_status_font_size(font_sizes.get("status_bar", 9))
+        viewer.set_log_font_size(self._log_font_size)
+        viewer.set_ui_font_size(self._ui_font_size)
+        viewer.set_status_font_size(self._status_font_size)
 
         # Subscribe to log manager
-        logger.info(f"Subscribing viewer to log manager for: {path_key}")
+        logger.info("Subscribing viewer to log manager for: %s", path_key)
         self._log_manager.subscribe(path_key, viewer)
-        logger.info(f"Subscription complete for: {path_key}")
+        logger.info("Subscription complete for: %s", path_key)
 
         viewer.show()
         self._viewer_windows[path_key] = viewer
+        self._viewer_list.append(viewer)
 
         # Update open windows list
         self._save_open_windows()
 
-    def _on_content_available_for_auto_open(self, path_key: str, content: str) -> None:
-        """Handle content available signal for auto-opening windows.
+    def _other_viewers(self, viewer: "LogViewerWindow") -> list["LogViewerWindow"]:
+        """Get all open viewer windows except the given one.
+
+        Args:
+            viewer: Viewer window to exclude
+
+        Returns:
+            List of the other open viewer windows
+        """
+        return [v for v in self._viewer_list if v is not viewer]
+
+    def _all_windows(self) -> Iterator[QWidget]:
+        """Iterate open viewer windows, then group windows.
+
+        Returns:
+            Iterator over all open log windows
+        """
+        return chain(self._viewer_windows.values(), self._group_windows.values())
+
+    def _discard_windows(self) -> None:
+        """Hide and schedule deletion of all viewer and group windows.
+
+        The destroyed handlers are disconnected first so the deferred
+        deletions do not touch the bookkeeping or settings of whatever
+        session is active by the time they run. Callers clear the window
+        dicts themselves.
+        """
+        for window in self._all_windows():
+            window.destroyed.disconnect()
+            window.hide()
+            window.deleteLater()
+
+    def _forget_viewer(self, path_key: str) -> "LogViewerWindow | None":
+        """Drop a viewer window from the open-window bookkeeping.
 
         Args:
             path_key: Path key identifying the log file
-            content: Content (not used, just need to know content exists)
+
+        Returns:
+            The removed viewer window, or None if none was open
         """
-        if path_key in self._pending_window_opens:
-            # Check if buffer has content
-            buffer_content = self._log_manager.get_buffer_content(path_key)
-            if buffer_content:
-                logger.info(f"Auto-opening window for {path_key} (buffer has content)")
-                self._pending_window_opens.remove(path_key)
-                self._open_log_viewer(path_key, restore_position=True)
+        viewer = self._viewer_windows.pop(path_key, None)
+        if viewer is not None:
+            self._viewer_list.remove(viewer)
+        return viewer
+
+    def _on_content_available_for_auto_open(self, path_key: str) -> None:
+        """Handle a log's first content for auto-opening windows.
+
+        Args:
+            path_key: Path key identifying the log file
+        """
+        if path_key not in self._pending_window_opens:
+            return
+
+        self._pending_window_opens.discard(path_key)
+        self._ready_to_open.add(path_key)
+
+        # Coalesce restored logs into a single deferred batch open
+        if not self._auto_open_flush_scheduled:
+            self._auto_open_flush_scheduled = True
+            QTimer.singleShot(50, self._flush_auto_opens)
+
+    def _flush_auto_opens(self) -> None:
+        """Open all viewer windows whose content became available."""
+        self._auto_open_flush_scheduled = False
+        ready = self._ready_to_open
+        self._ready_to_open = set()
+
+        for path_key in ready:
+            # Log may have been unregistered before the batch ran
+            if path_key not in self._providers:
+                continue
+            logger.info("Auto-opening window for %s (buffer has content)", path_key)
+            self._open_log_viewer(path_key, restore_position=True)
 
     def _on_new_lines(self, path_key: str, text: str) -> None:
         """Handle new lines from a watcher thread (for UI feedback).
@@ -1630,32 +1916,55 @@ class MainWindow(QMainWindow):
             f"Updated window position for {path_key}: ({x}, {y}) {width}x{height}"
         )
 
-    def _on_viewer_closed(self, path_key: str) -> None:
-        """Handle viewer window being closed.
-
-        Args:
-            path_key: Path key identifying the log file
-        """
-        if path_key in self._viewer_windows:
-            viewer = self._viewer_windows[path_key]
-            # Unsubscribe from log manager
-            self._log_manager.unsubscribe(path_key, viewer)
-            logger.info(f"Unsubscribed viewer from log manager: {path_key}")
-            del self._viewer_windows[path_key]
-
-        # Update open windows list
-        self._save_open_windows()
-
     def _save_open_windows(self) -> None:
+        """Schedule saving the list of currently open viewer windows."""
+        if self._save_open_pending:
+            return
+        self._save_open_pending = True
+        QTimer.singleShot(200, self._do_save_open_windows)
+
+    def _do_save_open_windows(self) -> None:
         """Save list of currently open viewer windows."""
+        if not self._save_open_pending:
+            return
+        self._save_open_pending = False
         open_paths = list(self._viewer_windows.keys())
         self._settings.set_open_windows(open_paths)
 
-    def _save_groups(self) -> None:
+    def _save_groups(self, names_changed: bool = True) -> None:
+        """Schedule saving groups and log-to-group assignments.
+
+        Args:
+            names_changed: Whether the group name list changed, not only
+                log-to-group assignments
+        """
+        if names_changed:
+            self._save_group_names_pending = True
+        if self._save_groups_pending:
+            return
+        self._save_groups_pending = True
+        QTimer.singleShot(200, self._do_save_groups)
+
+    def _do_save_groups(self) -> None:
         """Save groups and log-to-group assignments."""
-        self._settings.set_groups(self._available_groups)
+        if not self._save_groups_pending:
+            return
+        self._save_groups_pending = False
+        # Assignment-only changes skip rewriting the session for the name list
+        if self._save_group_names_pending:
+            self._save_group_names_pending = False
+            self._settings.set_groups(list(self._available_groups))
         self._settings.set_log_groups(self._log_groups)
 
+    def _flush_pending_saves(self) -> None:
+        """Write any settings changes still waiting on their timers."""
+        self._do_save_open_windows()
+        self._do_save_groups()
+        self._font_debounce.stop()
+        self._apply_pending_font_sizes()
+        self._font_save_timer.stop()
+        self._save_font_sizes()
+
     def _restore_kubernetes_log(self, path_key: str) -> None:
         """Restore a Kubernetes log from session.
 
@@ -1663,169 +1972,257 @@ class MainWindow(QMainWindow):
             path_key: K8s path key (e.g., "k8s://namespace/pod" or "k8s://namespace/app=label")
         """
         try:
-            from logarithmic.providers.kubernetes_provider import KubernetesProvider
-
-            # Parse the path key
-            # Format: k8s://namespace/pod-name or k8s://namespace/pod-name/container
-            # or k8s://namespace/app=label
-            parts = path_key.replace("k8s://", "").split("/")
-
-            if len(parts) < 2:
-                logger.warning(f"Invalid K8s path key: {path_key}")
+            config = self._kubernetes_session_config(path_key)
+            if config is None:
+                logger.warning("Invalid K8s path key: %s", path_key)
                 return
 
-            namespace = parts[0]
-            pod_or_label = parts[1]
-            container = parts[2] if len(parts) > 2 else None
-
-            # Determine if it's an app label (wildcard) or single pod
-            is_deployment = pod_or_label.startswith("app=")
-            is_wildcard = is_deployment
-
-            # Get saved provider config (e.g., kubeconfig path)
-            saved_config = self._settings.get_provider_config(path_key)
-            kubeconfig_path = (
-                saved_config.get("kubeconfig_path") if saved_config else None
-            )
-
-            # Create provider config
-            config = KubernetesProvider.create_config(
-                namespace=namespace,
-                pod_name=pod_or_label,
-                container=container,
-                is_deployment=is_deployment,
-                mode=ProviderMode.TAIL_ONLY,
-                kubeconfig_path=kubeconfig_path,  # Restore saved kubeconfig path
-            )
+            # App label (wildcard) or single pod
+            is_deployment = config.get("is_deployment", False)
 
             # Add to list
-            self._add_log_to_list(path_key, is_wildcard=is_wildcard)
+            self._add_log_to_list(path_key, is_wildcard=is_deployment)
 
             # Register with log manager
             self._log_manager.register_log(path_key)
 
             # Create and start provider
-            provider = self._provider_registry.create_provider(
-                config, self._log_manager, path_key
-            )
-            provider.error_occurred.connect(
-                lambda err: self._on_watcher_error(path_key, err)
-            )
-            provider.start()
-
-            self._providers[path_key] = provider
-            self._provider_configs[path_key] = config
+            self._start_provider(path_key, config)
 
             mode_desc = "app label" if is_deployment else "pod"
-            logger.info(f"Restored K8s {mode_desc} log: {path_key}")
+            logger.info("Restored K8s %s log: %s", mode_desc, path_key)
 
         except Exception as e:
-            logger.error(f"Failed to restore K8s log {path_key}: {e}", exc_info=True)
+            logger.error("Failed to restore K8s log %s: %s", path_key, e, exc_info=True)
 
-    def _restore_session(self) -> None:
-        """Restore tracked logs and groups from previous session."""
+    def _kubernetes_session_config(self, path_key: str) -> ProviderConfig | None:
+        """Build the provider config the current session gives a K8s log.
+
+        Args:
+            path_key: K8s path key (e.g., "k8s://namespace/pod" or "k8s://namespace/app=label")
+
+        Returns:
+            Provider config, or None if the path key is invalid
+        """
+        from logarithmic.providers.kubernetes_provider import KubernetesProvider
+
+        # Parse the path key
+        # Format: k8s://namespace/pod-name or k8s://namespace/pod-name/container
+        # or k8s://namespace/app=label
+        parts = path_key.replace("k8s://", "").split("/")
+
+        if len(parts) < 2:
+            return None
+
+        namespace = parts[0]
+        pod_or_label = parts[1]
+        container = parts[2] if len(parts) > 2 else None
+
+        # Get saved provider config (e.g., kubeconfig path)
+        saved_config = self._settings.get_provider_config(path_key)
+        kubeconfig_path = saved_config.get("kubeconfig_path") if saved_config else None
+
+        return KubernetesProvider.create_config(
+            namespace=namespace,
+            pod_name=pod_or_label,
+            container=container,
+            is_deployment=pod_or_label.startswith("app="),
+            mode=ProviderMode.TAIL_ONLY,
+            kubeconfig_path=kubeconfig_path,  # Restore saved kubeconfig path
+        )
+
+    def _session_provider_config(self, path_key: str) -> ProviderConfig | None:
+        """Build the provider config the current session gives a tracked log.
+
+        Args:
+            path_key: Path key of the tracked log
+
+        Returns:
+            Provider config, or None for sources that can't be restored
+        """
+        if path_key.startswith("k8s://"):
+            return self._kubernetes_session_config(path_key)
+        if path_key.startswith(("kafka://", "pubsub://")):
+            return None
+        is_wildcard = _WILDCARD_RE.search(path_key) is not None
+        return FileProvider.create_config(path_key, is_wildcard=is_wildcard)
+
+    def _start_provider(self, path_key: str, config: ProviderConfig) -> None:
+        """Create, start and record the provider for a log.
+
+        Args:
+            path_key: Path key of the log
+            config: Provider configuration
+        """
+        provider = self._provider_registry.create_provider(
+            config, self._log_manager, path_key
+        )
+        provider.error_occurred.connect(partial(self._on_watcher_error, path_key))
+        provider.start()
+
+        self._providers[path_key] = provider
+        self._provider_configs[path_key] = config
+
+    def _apply_session_provider_config(self, path_key: str) -> None:
+        """Restart a kept log's provider if the new session configures it differently.
+
+        Args:
+            path_key: Path key of a log that already has a running provider
+        """
+        try:
+            config = self._session_provider_config(path_key)
+        except Exception as e:
+            logger.error("Failed to read session config for %s: %s", path_key, e)
+            return
+
+        current = self._provider_configs.get(path_key)
+        if config is None or (
+            current is not None and current.to_dict() == config.to_dict()
+        ):
+            return
+
+        self._stop_providers([self._providers[path_key]])
+        # Content came from the old source; start over like a refresh
+        self._log_manager.clear_buffer(path_key)
+        self._start_provider(path_key, config)
+        logger.info("Restarted provider with the session's config: %s", path_key)
+
+    def _restore_session(self, on_complete: Callable[[], None] | None = None) -> None:
+        """Restore tracked logs and groups from previous session.
+
+        Groups are restored at once; tracked logs are queued and restored
+        a chunk per event-loop tick so the window stays responsive.
+
+        Args:
+            on_complete: Called once every queued log has been restored
+        """
         # Restore groups first
         saved_groups = self._settings.get_groups()
-        self._available_groups = saved_groups.copy()
+        self._available_groups = dict.fromkeys(saved_groups)
+        self._sync_group_combo_items()
         for group_name in saved_groups:
             self._add_group_to_list(group_name)
-        logger.info(f"Restored {len(saved_groups)} groups")
+        logger.info("Restored %s groups", len(saved_groups))
 
         # Restore log-to-group assignments
         self._log_groups = self._settings.get_log_groups().copy()
+        self._group_to_logs.clear()
+        for path_key, group_name in self._log_groups.items():
+            self._group_to_logs[group_name][path_key] = None
 
         tracked_logs = self._settings.get_tracked_logs()
-        logger.info(f"Restoring {len(tracked_logs)} logs from previous session")
-
-        for path_str in tracked_logs:
-            try:
-                # Detect provider type from path_key
-                if path_str.startswith("k8s://"):
-                    # Restore Kubernetes log
-                    self._restore_kubernetes_log(path_str)
-                    continue
-                elif path_str.startswith("kafka://"):
-                    logger.warning(
-                        f"Kafka provider not yet implemented, skipping: {path_str}"
-                    )
-                    continue
-                elif path_str.startswith("pubsub://"):
-                    logger.warning(
-                        f"PubSub provider not yet implemented, skipping: {path_str}"
-                    )
-                    continue
+        logger.info("Restoring %s logs from previous session", len(tracked_logs))
 
-                # Check if it's a wildcard pattern (for files)
-                is_wildcard = "*" in path_str or "?" in path_str
+        # Mark ALL tracked logs for auto-opening once content is available
+        # This ensures windows open automatically when the app starts
+        logger.info("Marking %s windows for auto-open", len(tracked_logs))
 
-                if is_wildcard:
-                    # Restore wildcard pattern using provider
-                    pattern_path = Path(path_str)
-                    if not pattern_path.parent.exists():
-                        logger.warning(
-                            f"Skipping pattern (parent dir missing): {path_str}"
-                        )
-                        continue
+        for path_str in tracked_logs:
+            self._pending_window_opens.add(path_str)
+            logger.info("Will auto-open window for: %s", path_str)
+            # A log kept from before won't signal first content again
+            if self._log_manager.has_content(path_str):
+                self._on_content_available_for_auto_open(path_str)
+
+        # Logs often share a directory; check each one only once per restore
+        self._restore_checked_dirs = {}
+        self._restore_queue = deque(tracked_logs)
+        if on_complete is not None:
+            # A restore cut short by this one still owes its own callback
+            previous = self._restore_on_complete
+            if previous is None:
+                self._restore_on_complete = on_complete
+            else:
+                self._restore_on_complete = lambda: (previous(), on_complete())
+        if not self._restore_scheduled:
+            self._restore_scheduled = True
+            QTimer.singleShot(0, self._restore_next_chunk)
+
+    def _restore_next_chunk(self) -> None:
+        """Restore the next chunk of queued logs and reschedule until done."""
+        self._restore_scheduled = False
+        with _batched_updates(self.log_list):
+            for _ in range(min(_RESTORE_CHUNK_SIZE, len(self._restore_queue))):
+                path_str = self._restore_queue.popleft()
+                try:
+                    self._restore_log(path_str)
+                except Exception as e:
+                    logger.error("Failed to restore log %s: %s", path_str, e)
+
+        if self._restore_queue:
+            self._restore_scheduled = True
+            QTimer.singleShot(0, self._restore_next_chunk)
+            return
 
-                    # Add to list with wildcard indicator
-                    self._add_log_to_list(path_str, is_wildcard=True)
+        logger.info("Session restore complete")
+        on_complete = self._restore_on_complete
+        self._restore_on_complete = None
+        if on_complete is not None:
+            on_complete()
 
-                    # Register with log manager
-                    self._log_manager.register_log(path_str)
+    def _restore_log(self, path_str: str) -> None:
+        """Register and start the provider for one tracked log.
 
-                    # Create and start provider
-                    config = FileProvider.create_config(path_str, is_wildcard=True)
-                    provider = self._provider_registry.create_provider(
-                        config, self._log_manager, path_str
-                    )
-                    provider.error_occurred.connect(
-                        lambda err, pk=path_str: self._on_watcher_error(pk, err)
-                    )
-                    provider.start()
+        Args:
+            path_str: Path key of the tracked log
+        """
+        # Logs kept across a session switch keep their row and running
+        # provider, unless the new session configures the source differently
+        if path_str in self._providers:
+            self._apply_session_provider_config(path_str)
+            return
 
-                    self._providers[path_str] = provider
-                    self._provider_configs[path_str] = config
-                    logger.info(f"Restored wildcard pattern via provider: {path_str}")
+        # Detect provider type from path_key
+        if path_str.startswith("k8s://"):
+            # Restore Kubernetes log
+            self._restore_kubernetes_log(path_str)
+            return
+        elif path_str.startswith("kafka://"):
+            logger.warning("Kafka provider not yet implemented, skipping: %s", path_str)
+            return
+        elif path_str.startswith("pubsub://"):
+            logger.warning(
+                "PubSub provider not yet implemented, skipping: %s", path_str
+            )
+            return
 
-                else:
-                    # Restore regular file using provider
-                    file_path = Path(path_str)
+        # Check if it's a wildcard pattern (for files)
+        is_wildcard = _WILDCARD_RE.search(path_str) is not None
 
-                    # Check parent directory exists
-                    if not file_path.parent.exists():
-                        logger.warning(f"Skipping log (parent dir missing): {path_str}")
-                        continue
+        if is_wildcard:
+            # Restore wildcard pattern using provider
+            if not _parent_dir_exists(path_str, self._restore_checked_dirs):
+                logger.warning("Skipping pattern (parent dir missing): %s", path_str)
+                return
 
-                    # Add to list
-                    self._add_log_to_list(path_str, is_wildcard=False)
+            # Add to list with wildcard indicator
+            self._add_log_to_list(path_str, is_wildcard=True)
 
-                    # Register with log manager
-                    self._log_manager.register_log(path_str)
+            # Register with log manager
+            self._log_manager.register_log(path_str)
 
-                    # Create and start provider
-                    config = FileProvider.create_config(path_str, is_wildcard=False)
-                    provider = self._provider_registry.create_provider(
-                        config, self._log_manager, path_str
-                    )
-                    provider.error_occurred.connect(
-                        lambda err, pk=path_str: self._on_watcher_error(pk, err)
-                    )
-                    provider.start()
+            # Create and start provider
+            config = FileProvider.create_config(path_str, is_wildcard=True)
+            self._start_provider(path_str, config)
+            logger.info("Restored wildcard pattern via provider: %s", path_str)
 
-                    self._providers[path_str] = provider
-                    self._provider_configs[path_str] = config
-                    logger.info(f"Restored file log via provider: {path_str}")
+        else:
+            # Restore regular file using provider
+            # Check parent directory exists
+            if not _parent_dir_exists(path_str, self._restore_checked_dirs):
+                logger.warning("Skipping log (parent dir missing): %s", path_str)
+                return
 
-            except Exception as e:
-                logger.error(f"Failed to restore log {path_str}: {e}")
+            # Add to list
+            self._add_log_to_list(path_str, is_wildcard=False)
 
-        # Mark ALL tracked logs for auto-opening once content is available
-        # This ensures windows open automatically when the app starts
-        logger.info(f"Marking {len(tracked_logs)} windows for auto-open")
+            # Register with log manager
+            self._log_manager.register_log(path_str)
 
-        for path_str in tracked_logs:
-            self._pending_window_opens.add(path_str)
-            logger.info(f"Will auto-open window for: {path_str}")
+            # Create and start provider
+            config = FileProvider.create_config(path_str, is_wildcard=False)
+            self._start_provider(path_str, config)
+            logger.info("Restored file log via provider: %s", path_str)
 
     def _initialize_mcp_server(self) -> None:
         """Initialize and start MCP server if enabled in settings."""
@@ -1897,27 +2294,18 @@ class MainWindow(QMainWindow):
 
         logger.info("Creating new session")
 
-        # Unsubscribe all viewers from log manager BEFORE closing
-        for path_key, viewer in list(self._viewer_windows.items()):
-            self._log_manager.unsubscribe(path_key, viewer)
+        # Drop logs from the old session that are still waiting to be restored
+        self._restore_queue.clear()
 
-        # Unsubscribe all group windows from log manager
-        for group_name, group_window in list(self._group_windows.items()):
-            for path_key in list(self._log_groups.keys()):
-                if self._log_groups.get(path_key) == group_name:
-                    self._log_manager.unsubscribe(path_key, group_window)
+        # Unsubscribe all viewer and group windows from log manager BEFORE closing
+        for window in self._all_windows():
+            self._log_manager.unsubscribe_subscriber(window)
 
         # Stop all providers
-        for provider in self._providers.values():
-            provider.stop()
+        self._stop_providers(self._providers.values())
 
-        # Close all viewer windows
-        for viewer in list(self._viewer_windows.values()):
-            viewer.close()
-
-        # Close all group windows
-        for group_window in list(self._group_windows.values()):
-            group_window.close()
+        # Delete all viewer and group windows
+        self._discard_windows()
 
         # Unregister all logs from log manager
         for path_key in list(self._providers.keys()):
@@ -1927,11 +2315,16 @@ class MainWindow(QMainWindow):
         self._providers.clear()
         self._provider_configs.clear()
         self._viewer_windows.clear()
+        self._viewer_list.clear()
         self._group_windows.clear()
         self._log_groups.clear()
+        self._group_to_logs.clear()
         self._available_groups.clear()
+        self._sync_group_combo_items()
         self.log_list.clear()
+        self._log_items.clear()
         self.groups_list.clear()
+        self._group_items.clear()
 
         # Clear settings
         self._settings.clear_tracked_logs()
@@ -1943,18 +2336,48 @@ class MainWindow(QMainWindow):
 
         logger.info("New session created")
 
+    def _stop_providers(
+        self, providers: Iterable[LogProvider], timeout_ms: int = 5000
+    ) -> None:
+        """Stop providers and wait for their threads to finish.
+
+        Every provider is signalled before any wait, so the threads wind down
+        concurrently and the total time is bounded by the slowest provider.
+        Providers that block on stop (e.g. Kubernetes streams stuck in a
+        socket read) are only signalled; closeEvent does the forced wait.
+
+        Args:
+            providers: Providers to stop
+            timeout_ms: Timeout in milliseconds for each wait
+        """
+        providers = list(providers)
+        for provider in providers:
+            provider.stop()
+
+        for provider in providers:
+            if provider.blocks_on_stop:
+                continue
+            if not provider.wait(timeout_ms):
+                logger.warning(
+                    "Provider thread did not finish in time: %s", provider.path_key
+                )
+
     def _on_set_all_window_sizes(self) -> None:
         """Set all log viewer and group windows to the default size."""
         default_width, default_height = self._settings.get_default_window_size()
 
+        target = (default_width, default_height)
         count = 0
         for viewer in self._viewer_windows.values():
-            viewer.resize(default_width, default_height)
-            count += 1
+            # Skip windows already at the target size to avoid a resize pass
+            if (viewer.width(), viewer.height()) != target:
+                viewer.resize(default_width, default_height)
+                count += 1
 
         for group_window in self._group_windows.values():
-            group_window.resize(default_width, default_height)
-            count += 1
+            if (group_window.width(), group_window.height()) != target:
+                group_window.resize(default_width, default_height)
+                count += 1
 
         logger.info(f"Resized {count} windows to {default_width}x{default_height}")
 
@@ -1981,22 +2404,21 @@ class MainWindow(QMainWindow):
             # Clear buffer and reload file from beginning
             self._log_manager.clear_buffer(path_key)
 
-            # Restart the provider
-            if path_key in self._providers:
-                provider = self._providers[path_key]
-                provider.stop()
+        # Stop all providers together before recreating them
+        self._stop_providers(self._providers.values())
 
-                # Recreate provider from config
-                config = self._provider_configs.get(path_key)
-                if config:
-                    new_provider = self._provider_registry.create_provider(
-                        config, self._log_manager, path_key
-                    )
-                    new_provider.error_occurred.connect(
-                        lambda err, pk=path_key: self._on_watcher_error(pk, err)
-                    )
-                    new_provider.start()
-                    self._providers[path_key] = new_provider
+        for path_key in all_path_keys:
+            # Recreate provider from config
+            config = self._provider_configs.get(path_key)
+            if config:
+                new_provider = self._provider_registry.create_provider(
+                    config, self._log_manager, path_key
+                )
+                new_provider.error_occurred.connect(
+                    partial(self._on_watcher_error, path_key)
+                )
+                new_provider.start()
+                self._providers[path_key] = new_provider
 
         logger.info(f"Restarted {len(all_path_keys)} stream(s)")
 
@@ -2011,12 +2433,9 @@ class MainWindow(QMainWindow):
         offset_y = main_pos.y() + 50
 
         # Cascade all windows (viewers + groups)
-        all_windows = list(self._viewer_windows.values()) + list(
-            self._group_windows.values()
-        )
-        for i, window in enumerate(all_windows):
-            window.move(offset_x + (i * 30), offset_y + (i * 30))
-            window.resize(800, 600)
+        for i, window in enumerate(self._all_windows()):
+            # One geometry change per window instead of separate move + resize
+            window.setGeometry(offset_x + (i * 30), offset_y + (i * 30), 800, 600)
 
     def _move_all_windows_to_cursor(self) -> None:
         """Move all windows (main, viewers, groups) to the mouse cursor location.
@@ -2085,6 +2504,9 @@ class MainWindow(QMainWindow):
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop event - supports both files and folders.
 
+        Holding Shift while dropping tracks dropped files in dedicated mode
+        without asking; folders always ask for a wildcard pattern.
+
         Args:
             event: Drop event
         """
@@ -2092,30 +2514,57 @@ class MainWindow(QMainWindow):
         if not urls:
             return
 
-        for url in urls:
-            path_str = url.toLocalFile()
-            if not path_str:
+        paths = [url.toLocalFile() for url in urls if url.toLocalFile()]
+        if not paths:
+            return
+
+        # Stat every dropped path up front so dialogs don't wait on disk I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            kinds = list(pool.map(_drop_path_kind, paths))
+
+        invalid = [p for p, kind in zip(paths, kinds, strict=True) if kind is None]
+
+        skip_dialog = bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
+        already_tracked = []
+        failed = []
+        for path_str, kind in zip(paths, kinds, strict=True):
+            if kind is None:
                 continue
 
-            path_obj = Path(path_str)
-
-            # Support both files and folders
-            if path_obj.is_file():
-                # Show tracking mode dialog for file
-                dialog = TrackingModeDialog(path_str, is_folder=False, parent=self)
-                if dialog.exec() == QDialog.DialogCode.Accepted:
-                    self._add_log_from_dialog(dialog)
-            elif path_obj.is_dir():
-                # Show tracking mode dialog for folder (wildcard only)
-                dialog = TrackingModeDialog(path_str, is_folder=True, parent=self)
-                if dialog.exec() == QDialog.DialogCode.Accepted:
-                    self._add_log_from_dialog(dialog)
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Invalid Drop",
-                    f"Path does not exist or is not accessible:\n{path_str}",
-                )
+            if skip_dialog and kind == "file":
+                if path_str in self._providers:
+                    already_tracked.append(Path(path_str).name)
+                    continue
+                try:
+                    self._track_file_log(path_str, is_wildcard=False)
+                except Exception as e:
+                    failed.append(f"{path_str}: {e}")
+                continue
+
+            # Folders are tracked with a wildcard pattern only
+            dialog = TrackingModeDialog(
+                path_str, is_folder=(kind == "folder"), parent=self
+            )
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self._add_log_from_dialog(dialog)
+
+        # Report every unusable path in one warning instead of one per path
+        problems = []
+        if invalid:
+            problems.append(
+                "Path does not exist or is not accessible:\n" + "\n".join(invalid)
+            )
+        if failed:
+            problems.append("Failed to add log file:\n" + "\n".join(failed))
+        if problems:
+            QMessageBox.warning(self, "Invalid Drop", "\n\n".join(problems))
+
+        if already_tracked:
+            QMessageBox.information(
+                self,
+                "Already Tracking",
+                "Already tracking:\n" + "\n".join(already_tracked),
+            )
 
         event.acceptProposedAction()
 
@@ -2125,101 +2574,28 @@ class MainWindow(QMainWindow):
         Args:
             dialog: Tracking mode dialog with user selections
         """
-        try:
-            if dialog.tracking_mode == "wildcard":
-                path_key = dialog.wildcard_pattern
-
-                # Check if already tracking
-                if path_key in self._providers:
-                    QMessageBox.information(
-                        self,
-                        "Already Tracking",
-                        f"Already tracking pattern: {path_key}",
-                    )
-                    return
-
-                # Validate parent directory exists
-                pattern_path = Path(path_key)
-                if not pattern_path.parent.exists():
-                    raise InvalidPathError(
-                        f"Parent directory does not exist: {pattern_path.parent}"
-                    )
-
-                # Create provider config
-                config = FileProvider.create_config(path_key, is_wildcard=True)
+        is_wildcard = dialog.tracking_mode == "wildcard"
+        path_key = dialog.wildcard_pattern if is_wildcard else dialog.path
+        self._add_file_log(path_key, is_wildcard=is_wildcard)
 
-                # Add to list
-                self._add_log_to_list(path_key, is_wildcard=True)
-
-                # Register with log manager
-                self._log_manager.register_log(path_key)
-
-                # Create and start provider
-                provider = self._provider_registry.create_provider(
-                    config, self._log_manager, path_key
-                )
-                provider.error_occurred.connect(
-                    lambda err: self._on_watcher_error(path_key, err)
-                )
-                provider.start()
+    def _add_file_log(self, path_key: str, is_wildcard: bool) -> None:
+        """Start tracking a dropped file or wildcard pattern.
 
-                self._providers[path_key] = provider
-                self._provider_configs[path_key] = config
-
-                # Save to settings
-                self._settings.add_tracked_log(path_key)
-                logger.info(
-                    f"Added wildcard pattern via drag-drop (provider): {path_key}"
-                )
-
-            else:  # dedicated
-                path_key = dialog.path
-                file_path = Path(path_key)
-
-                # Check if already tracking
-                if path_key in self._providers:
-                    QMessageBox.information(
-                        self,
-                        "Already Tracking",
-                        f"Already tracking: {file_path.name}",
-                    )
-                    return
-
-                # Validate path
-                if not file_path.parent.exists():
-                    raise InvalidPathError(
-                        f"Parent directory does not exist: {file_path.parent}"
-                    )
-
-                # Check read permissions (if file exists)
-                if file_path.exists() and not os.access(file_path, os.R_OK):
-                    raise FileAccessError(f"Cannot read file: {file_path}")
-
-                # Create provider config
-                config = FileProvider.create_config(path_key, is_wildcard=False)
-
-                # Add to list
-                self._add_log_to_list(path_key, is_wildcard=False)
-
-                # Register with log manager
-                self._log_manager.register_log(path_key)
-
-                # Create and start provider
-                provider = self._provider_registry.create_provider(
-                    config, self._log_manager, path_key
-                )
-                provider.error_occurred.connect(
-                    lambda err: self._on_watcher_error(path_key, err)
-                )
-                provider.start()
-
-                self._providers[path_key] = provider
-                self._provider_configs[path_key] = config
-
-                # Save to settings
-                self._settings.add_tracked_log(path_key)
-                logger.info(f"Added log via drag-drop (provider): {path_key}")
+        Args:
+            path_key: File path or wildcard pattern
+            is_wildcard: Whether path_key is a wildcard pattern
+        """
+        # Check if already tracking
+        if path_key in self._providers:
+            if is_wildcard:
+                message = f"Already tracking pattern: {path_key}"
+            else:
+                message = f"Already tracking: {Path(path_key).name}"
+            QMessageBox.information(self, "Already Tracking", message)
+            return
 
+        try:
+            self._track_file_log(path_key, is_wildcard)
         except (InvalidPathError, FileAccessError) as e:
             QMessageBox.warning(
                 self,
@@ -2233,6 +2609,48 @@ class MainWindow(QMainWindow):
                 f"Failed to add log file:\n{e}",
             )
 
+    def _track_file_log(self, path_key: str, is_wildcard: bool) -> None:
+        """Validate a file or wildcard pattern and start tracking it.
+
+        Args:
+            path_key: File path or wildcard pattern
+            is_wildcard: Whether path_key is a wildcard pattern
+
+        Raises:
+            InvalidPathError: If the parent directory does not exist
+            FileAccessError: If the file exists but cannot be read
+        """
+        # Validate parent directory exists
+        if not _parent_dir_exists(path_key):
+            raise InvalidPathError(
+                f"Parent directory does not exist: {Path(path_key).parent}"
+            )
+
+        # Check read permissions (if file exists)
+        if (
+            not is_wildcard
+            and os.path.exists(path_key)
+            and not os.access(path_key, os.R_OK)
+        ):
+            raise FileAccessError(f"Cannot read file: {Path(path_key)}")
+
+        # Create provider config
+        config = FileProvider.create_config(path_key, is_wildcard=is_wildcard)
+
+        # Add to list
+        self._add_log_to_list(path_key, is_wildcard=is_wildcard)
+
+        # Register with log manager
+        self._log_manager.register_log(path_key)
+
+        # Create and start provider
+        self._start_provider(path_key, config)
+
+        # Save to settings
+        self._settings.add_tracked_log(path_key)
+        kind = "wildcard pattern" if is_wildcard else "log"
+        logger.info(f"Added {kind} via drag-drop (provider): {path_key}")
+
     def moveEvent(self, event) -> None:
         """Handle main window move event."""
         super().moveEvent(event)
@@ -2244,6 +2662,10 @@ class MainWindow(QMainWindow):
         self._save_main_window_position()
 
     def _save_main_window_position(self) -> None:
+        """Schedule saving the main window position."""
+        self._main_position_timer.start()
+
+    def _flush_main_window_position(self) -> None:
         """Save main window position if changed."""
         pos = self.pos()
         size = self.size()
@@ -2281,6 +2703,10 @@ class MainWindow(QMainWindow):
         """
         logger.info("Main window closing, stopping all providers and watchers...")
 
+        # Don't start providers for logs still waiting to be restored
+        self._restore_queue.clear()
+        self._restore_on_complete = None
+
         try:
             # Create and show shutdown dialog
             shutdown_dialog = ShutdownDialog(self)
@@ -2291,6 +2717,13 @@ class MainWindow(QMainWindow):
 
             QApplication.processEvents()
 
+            # Flush any settings writes still waiting on their timers
+            self._flush_pending_saves()
+            if self._main_position_timer.isActive():
+                self._main_position_timer.stop()
+                self._flush_main_window_position()
+            self._settings.flush()
+
             # Stop version checker thread
             if self._version_checker:
                 self._version_checker.stop()
@@ -2309,38 +2742,37 @@ class MainWindow(QMainWindow):
                 logger.debug(f"Stopping provider for: {path_key}")
                 provider.stop()
 
-            # Wait for all provider threads to finish (with timeout)
-            total_providers = len(self._providers)
-            for idx, (path_key, provider) in enumerate(self._providers.items(), 1):
-                # Check if provider has a thread to wait for
-                if hasattr(provider, "wait"):
-                    shutdown_dialog.update_status(
-                        f"Waiting for providers to finish ({idx}/{total_providers})..."
-                    )
-                    QApplication.processEvents()
-                    logger.debug(f"Waiting for provider thread to finish: {path_key}")
-                    # K8s threads may be blocked in socket reads, give them more time
-                    timeout = 5000 if path_key.startswith("k8s://") else 3000
-                    if not provider.wait(timeout):
-                        logger.warning(
-                            f"Provider thread did not finish in time: {path_key} "
-                            "(this is normal for K8s streams blocked in socket reads)"
-                        )
-                    else:
-                        logger.debug(f"Provider thread finished: {path_key}")
-
-            # Close all viewer windows
+            # Close windows while the provider threads wind down
             shutdown_dialog.update_status("Closing viewer windows...")
             QApplication.processEvents()
             for viewer in list(self._viewer_windows.values()):
                 viewer.close()
 
-            # Close all group windows
             shutdown_dialog.update_status("Closing group windows...")
             QApplication.processEvents()
             for group_window in list(self._group_windows.values()):
                 group_window.close()
 
+            # Wait for all provider threads to finish, sharing one deadline
+            deadline = time.monotonic() + 5.0
+            total_providers = len(self._providers)
+            for idx, (path_key, provider) in enumerate(self._providers.items(), 1):
+                shutdown_dialog.update_status(
+                    f"Waiting for providers to finish ({idx}/{total_providers})..."
+                )
+                QApplication.processEvents()
+                logger.debug(f"Waiting for provider thread to finish: {path_key}")
+                # K8s threads may be blocked in socket reads, give them more time
+                timeout = 5000 if path_key.startswith("k8s://") else 3000
+                remaining = max(0, int((deadline - time.monotonic()) * 1000))
+                if not provider.wait(min(timeout, remaining)):
+                    logger.warning(
+                        f"Provider thread did not finish in time: {path_key} "
+                        "(this is normal for K8s streams blocked in socket reads)"
+                    )
+                else:
+                    logger.debug(f"Provider thread finished: {path_key}")
+
             # Close shutdown dialog
             shutdown_dialog.close()
 
@@ -2363,11 +2795,10 @@ class MainWindow(QMainWindow):
         sessions = self._settings.get_available_sessions()
         self.session_combo.addItems(sessions)
 
-        # Set current session
+        # Set current session by row, from the list we just added
         current = self._settings.get_current_session()
-        index = self.session_combo.findText(current)
-        if index >= 0:
-            self.session_combo.setCurrentIndex(index)
+        if current in sessions:
+            self.session_combo.setCurrentIndex(sessions.index(current))
 
         self.session_combo.blockSignals(False)
 
@@ -2402,37 +2833,74 @@ class MainWindow(QMainWindow):
         """
         logger.info(f"Switching to session: {session_name}")
 
-        # Unsubscribe all viewers from log manager BEFORE closing
-        for path_key, viewer in list(self._viewer_windows.items()):
-            self._log_manager.unsubscribe(path_key, viewer)
+        # Save pending changes to the old session before tearing down
+        self._flush_pending_saves()
 
-        # Unsubscribe all group windows from log manager
-        for group_name, group_window in list(self._group_windows.items()):
-            for path_key in list(self._log_groups.keys()):
-                if self._log_groups.get(path_key) == group_name:
-                    self._log_manager.unsubscribe(path_key, group_window)
+        # Repaint the main window once, after the synchronous teardown and
+        # the first restore step; queued logs then restore chunk by chunk
+        self.setUpdatesEnabled(False)
+        try:
+            # Unsubscribe all viewer and group windows from log manager BEFORE closing
+            for window in self._all_windows():
+                self._log_manager.unsubscribe_subscriber(window)
+
+            # Delete all windows without running their close handlers
+            self._discard_windows()
+
+            # Clear data structures
+            self._viewer_windows.clear()
+            self._viewer_list.clear()
+            self._group_windows.clear()
+            self._log_groups.clear()
+            self._group_to_logs.clear()
+            self._available_groups.clear()
+            self._sync_group_combo_items()
+            self.groups_list.clear()
+            self._group_items.clear()
+
+            # Switch session in settings
+            self._settings.switch_session(session_name)
+            self._load_font_sizes()
 
-        # Close all windows
-        for viewer in list(self._viewer_windows.values()):
-            viewer.close()
-        for group_window in list(self._group_windows.values()):
-            group_window.close()
+            # Keep the rows and providers of logs the new session also tracks
+            self._drop_logs_not_in(set(self._settings.get_tracked_logs()))
 
-        # Clear data structures
-        self._viewer_windows.clear()
-        self._group_windows.clear()
-        self._log_groups.clear()
-        self._available_groups.clear()
-        self.log_list.clear()
-        self.groups_list.clear()
+            # Restore new session; kept rows then pick up its groups
+            self._restore_session()
+            self._refresh_all_log_items()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
-        # Switch session in settings
-        self._settings.switch_session(session_name)
+        logger.info(f"Switched to session: {session_name}")
 
-        # Restore new session
-        self._restore_session()
+    def _drop_logs_not_in(self, keep: set[str]) -> None:
+        """Stop and remove every tracked log that is not in keep.
 
-        logger.info(f"Switched to session: {session_name}")
+        Args:
+            keep: Path keys whose rows and providers stay in place
+        """
+        dropped = [p for p in {**self._log_items, **self._providers} if p not in keep]
+        if not dropped:
+            return
+
+        self._stop_providers(
+            self._providers[p] for p in dropped if p in self._providers
+        )
+
+        with _batched_updates(self.log_list):
+            for path_key in dropped:
+                self._providers.pop(path_key, None)
+                self._provider_configs.pop(path_key, None)
+                self._log_manager.unregister_log(path_key)
+                if self._mcp_bridge:
+                    self._mcp_bridge.unsubscribe_from_log(path_key)
+
+                item = self._log_items.pop(path_key, None)
+                if item is not None:
+                    self.log_list.takeItem(self.log_list.row(item))
+
+        logger.info(f"Dropped {len(dropped)} logs not tracked by the new session")
 
     def _on_save_session(self) -> None:
         """Handle Save button click - saves current session."""
@@ -2469,8 +2937,9 @@ class MainWindow(QMainWindow):
 
         # Save the session
         if session_name == current_session:
-            # Just save current session
-            self._settings._save()
+            # Just save current session, including changes waiting on timers
+            self._flush_pending_saves()
+            self._settings.save()
             logger.info(f"Saved session: {session_name}")
         else:
             # Save as new session and switch to it
@@ -2608,16 +3077,8 @@ class MainWindow(QMainWindow):
 
         self._log_font_size = new_size
         self.log_font_size_value.setText(f"{new_size} pt")
-        self._settings.set_font_size("log_content", new_size)
-        logger.info(f"Log content font size changed to {new_size}")
-
-        # Update all open log viewer windows
-        for viewer in self._viewer_windows.values():
-            viewer.set_log_font_size(new_size)
-
-        # Update all group windows
-        for group_window in self._group_windows.values():
-            group_window.set_log_font_size(new_size)
+        self._pending_font_sizes["log_content"] = new_size
+        self._font_debounce.start()
 
     def _change_ui_font_size(self, delta: int) -> None:
         """Change UI elements font size by delta.
@@ -2631,21 +3092,8 @@ class MainWindow(QMainWindow):
 
         self._ui_font_size = new_size
         self.ui_font_size_value.setText(f"{new_size} pt")
-        self._settings.set_font_size("ui_elements", new_size)
-        logger.info(f"UI elements font size changed to {new_size}")
-
-        # Update all UI elements
-        for element in self._ui_elements:
-            element.setFont(self._fonts.get_ui_font(new_size))
-
-        # Update tab widgets
-        self.tabs.setFont(self._fonts.get_ui_font(new_size))
-
-        # Update log list items
-        self._refresh_all_log_items()
-
-        # Update group list items
-        self._refresh_all_group_items()
+        self._pending_font_sizes["ui_elements"] = new_size
+        self._font_debounce.start()
 
     def _change_status_font_size(self, delta: int) -> None:
         """Change status bar font size by delta.
@@ -2659,21 +3107,59 @@ class MainWindow(QMainWindow):
 
         self._status_font_size = new_size
         self.status_font_size_value.setText(f"{new_size} pt")
-        self._settings.set_font_size("status_bar", new_size)
-        logger.info(f"Status bar font size changed to {new_size}")
-
-    def _on_status_font_size_changed(self, size: int) -> None:
-        """Handle status bar font size change."""
-        self._settings.set_font_size("status_bar", size)
-        logger.info(f"Status bar font size changed to {size}")
-
-        # Update all open log viewer windows
-        for viewer in self._viewer_windows.values():
-            viewer.set_status_font_size(size)
+        self._pending_font_sizes["status_bar"] = new_size
+        self._font_debounce.start()
+
+    def _apply_pending_font_sizes(self) -> None:
+        """Apply the font sizes chosen since the last flush."""
+        pending = self._pending_font_sizes
+        self._pending_font_sizes = {}
+        if not pending:
+            return
 
-        # Update all group windows
-        for group_window in self._group_windows.values():
-            group_window.set_status_font_size(size)
+        for key, size in pending.items():
+            logger.info(f"Font size {key} changed to {size}")
+
+        # Persist later, in one write for all elements
+        self._unsaved_font_sizes.update(pending)
+        self._font_save_timer.start()
+
+        log_size = pending.get("log_content")
+        if log_size is not None:
+            # Update all open log viewer and group windows
+            set_log_size = methodcaller("set_log_font_size", log_size)
+            for window in self._all_windows():
+                set_log_size(window)
+
+        ui_size = pending.get("ui_elements")
+        if ui_size is not None:
+            # Update all UI elements
+            font = self._fonts.get_ui_font(ui_size)
+            for element in self._ui_elements:
+                element.setFont(font)
+
+            # Update tab widgets
+            self.tabs.setFont(font)
+
+            # Update log list items
+            self._refresh_all_log_items()
+
+            # Update group list items
+            self._refresh_all_group_items()
+
+        status_size = pending.get("status_bar")
+        if status_size is not None:
+            # Update all open log viewer and group windows
+            set_status_size = methodcaller("set_status_font_size", status_size)
+            for window in self._all_windows():
+                set_status_size(window)
+
+    def _save_font_sizes(self) -> None:
+        """Write applied font sizes to the session settings."""
+        if not self._unsaved_font_sizes:
+            return
+        self._settings.set_font_sizes(self._unsaved_font_sizes)
+        self._unsaved_font_sizes = {}
 
     # MCP Server Settings Handlers
 
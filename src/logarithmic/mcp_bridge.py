@@ -1,20 +1,32 @@
 """MCP Bridge - Thread-safe intermediary between LogManager and MCP Server."""
 
 import logging
+import re
 import threading
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
+from typing import Iterable
 
 from logarithmic.log_manager import LogManager
 from logarithmic.log_manager import LogSubscriber
 from logarithmic.settings import Settings
 
 if TYPE_CHECKING:
+    from logarithmic.content_controller import ContentController
     from logarithmic.log_group_window import LogGroupWindow
 
 logger = logging.getLogger(__name__)
 
+# Lines of content kept per log when settings don't say otherwise
+DEFAULT_MAX_CACHED_LINES = 10000
+
+# One line with its "\n", or a trailing partial line. Unlike splitlines(),
+# only "\n" ends a line, so "\r\n" pairs split across chunks stay intact
+_LINE_RE = re.compile(r"[^\n]*\n|[^\n]+")
+
 
 class McpBridge(LogSubscriber):
     """Thread-safe bridge between LogManager and MCP Server.
@@ -33,16 +45,36 @@ class McpBridge(LogSubscriber):
         """
         self._log_manager = log_manager
         self._settings = settings
-        self._lock = threading.RLock()
-
-        # Cache of log content: path_key -> content
-        self._log_cache: dict[str, str] = {}
+        # Leaf lock, not reentrant: nothing that takes another lock or calls
+        # back into the bridge may run while it is held. LogManager.subscribe
+        # replays buffered content into on_log_content, so calls into the
+        # log manager always happen after the lock is released. Settings
+        # metadata is likewise read outside it; the lock only guards the
+        # bridge's own caches.
+        self._lock = threading.Lock()
+
+        # Cache of log content: path_key -> most recent lines, joined on read
+        mcp_settings = settings.get_mcp_server_settings()
+        self._max_lines = int(
+            mcp_settings.get("max_cached_lines", DEFAULT_MAX_CACHED_LINES)
+        )
+        self._log_cache: dict[str, deque[str]] = {}
+        # Joined content per log, dropped whenever its lines change
+        self._joined_cache: dict[str, str] = {}
 
         # Track subscriptions
         self._subscribed_paths: set[str] = set()
 
-        # Callbacks for MCP server to be notified of updates
-        self._update_callbacks: list[Callable[[str, str], None]] = []
+        # Metadata id -> path keys, rebuilt when the settings revision changes
+        self._id_index: dict[str, list[str]] = {}
+        self._id_index_revision: int | None = None
+        # Path key -> reported id/description/path, same revision rule
+        self._fields_cache: dict[str, dict[str, str]] = {}
+        self._fields_revision: int | None = None
+
+        # Callbacks for MCP server to be notified of updates; replaced, never
+        # mutated, so readers can use the current tuple without copying
+        self._update_callbacks: tuple[Callable[[str, str], None], ...] = ()
 
         # Reference to group windows for combined view access
         self._group_windows_callback: (
@@ -55,16 +87,21 @@ class McpBridge(LogSubscriber):
         Args:
             path_key: Unique identifier for the log source
         """
+        # Lock-free fast path; set membership reads are atomic
         if path_key in self._subscribed_paths:
             return
 
+        # Check and claim under one lock so concurrent callers subscribe once
         with self._lock:
+            if path_key in self._subscribed_paths:
+                return
             self._subscribed_paths.add(path_key)
-            self._log_cache[path_key] = ""
+            self._log_cache[path_key] = deque(maxlen=self._max_lines)
+            self._joined_cache.pop(path_key, None)
 
         # Subscribe to log manager
         self._log_manager.subscribe(path_key, self)
-        logger.info(f"MCP Bridge subscribed to: {path_key}")
+        logger.info("MCP Bridge subscribed to: %s", path_key)
 
     def unsubscribe_from_log(self, path_key: str) -> None:
         """Unsubscribe from a log source.
@@ -76,18 +113,63 @@ class McpBridge(LogSubscriber):
             return
 
         with self._lock:
+            if path_key not in self._subscribed_paths:
+                return
             self._subscribed_paths.discard(path_key)
-            if path_key in self._log_cache:
-                del self._log_cache[path_key]
+            self._log_cache.pop(path_key, None)
+            self._joined_cache.pop(path_key, None)
+            self._fields_cache.pop(path_key, None)
 
         self._log_manager.unsubscribe(path_key, self)
-        logger.info(f"MCP Bridge unsubscribed from: {path_key}")
+        logger.info("MCP Bridge unsubscribed from: %s", path_key)
 
     def subscribe_to_all_tracked_logs(self) -> None:
         """Subscribe to all currently tracked logs."""
-        tracked_logs = self._settings.get_tracked_logs()
-        for path_key in tracked_logs:
-            self.subscribe_to_log(path_key)
+        self.subscribe_to_logs(self._settings.get_tracked_logs())
+
+    def subscribe_to_logs(self, path_keys: Iterable[str]) -> None:
+        """Subscribe to several log sources at once.
+
+        Args:
+            path_keys: Unique identifiers for the log sources
+        """
+        added: list[str] = []
+        with self._lock:
+            for path_key in path_keys:
+                if path_key in self._subscribed_paths:
+                    continue
+                self._subscribed_paths.add(path_key)
+                self._log_cache[path_key] = deque(maxlen=self._max_lines)
+                self._joined_cache.pop(path_key, None)
+                added.append(path_key)
+
+        if not added:
+            return
+
+        # Subscribe to log manager in one batch
+        self._log_manager.subscribe_many(added, self)
+        logger.info("MCP Bridge subscribed to %d logs", len(added))
+
+    def _cached_content(self, path_key: str) -> str:
+        """Join a log's cached lines into one string (call with lock held).
+
+        The joined string is kept until new content arrives, so repeated
+        reads don't join again.
+
+        Args:
+            path_key: Unique identifier for the log source
+
+        Returns:
+            Cached log content or empty string
+        """
+        joined = self._joined_cache.get(path_key)
+        if joined is None:
+            lines = self._log_cache.get(path_key)
+            if not lines:
+                return ""
+            joined = "".join(lines)
+            self._joined_cache[path_key] = joined
+        return joined
 
     def get_log_content(self, path_key: str) -> str:
         """Get cached log content (thread-safe).
@@ -99,7 +181,7 @@ class McpBridge(LogSubscriber):
             Cached log content or empty string
         """
         with self._lock:
-            return self._log_cache.get(path_key, "")
+            return self._cached_content(path_key)
 
     def get_all_logs(self) -> dict[str, dict[str, Any]]:
         """Get all tracked logs with metadata.
@@ -107,19 +189,18 @@ class McpBridge(LogSubscriber):
         Returns:
             Dictionary mapping path_key to log info (id, description, content)
         """
+        # Snapshot content under the lock; read metadata after releasing it
         with self._lock:
-            result = {}
-            for path_key in self._subscribed_paths:
-                metadata = self._settings.get_log_metadata(path_key)
-                result[path_key] = {
-                    "id": metadata.get("id", path_key) if metadata else path_key,
-                    "description": metadata.get("description", path_key)
-                    if metadata
-                    else path_key,
-                    "content": self._log_cache.get(path_key, ""),
-                    "path": path_key,
-                }
-            return result
+            contents = {
+                path_key: self._cached_content(path_key)
+                for path_key in self._subscribed_paths
+            }
+
+        fields = self._log_fields(contents)
+        return {
+            path_key: {**fields[path_key], "content": content}
+            for path_key, content in contents.items()
+        }
 
     def get_log_info(self, log_id: str) -> dict[str, Any] | None:
         """Get information about a specific log by ID.
@@ -130,33 +211,100 @@ class McpBridge(LogSubscriber):
         Returns:
             Log information dictionary or None if not found
         """
+        # Resolve the log and snapshot its content under the lock
+        id_paths = self._paths_for_id(log_id)
         with self._lock:
-            # First try to find by ID in metadata
-            all_metadata = self._settings.get_all_log_metadata()
-            for path_key, metadata in all_metadata.items():
-                if metadata.get("id") == log_id and path_key in self._subscribed_paths:
-                    return {
-                        "id": metadata["id"],
-                        "description": metadata.get("description", path_key),
-                        "content": self._log_cache.get(path_key, ""),
-                        "path": path_key,
-                    }
-
-            # Fallback: try as path_key
-            if log_id in self._subscribed_paths:
-                log_metadata: dict[str, str] | None = self._settings.get_log_metadata(
-                    log_id
-                )
-                return {
-                    "id": log_metadata.get("id", log_id) if log_metadata else log_id,
-                    "description": log_metadata.get("description", log_id)
-                    if log_metadata
-                    else log_id,
-                    "content": self._log_cache.get(log_id, ""),
-                    "path": log_id,
-                }
+            path_key = self._resolve_log_id(log_id, id_paths)
+            if path_key is None:
+                return None
+            content = self._cached_content(path_key)
 
-            return None
+        return {**self._log_fields([path_key])[path_key], "content": content}
+
+    def _log_fields(self, path_keys: Iterable[str]) -> dict[str, dict[str, str]]:
+        """Get the id, description and path fields reported for logs.
+
+        Kept until the settings metadata revision changes, so polling
+        callers don't rebuild them on every request. Never hand the
+        returned dicts out directly; copy them into the result. Only the
+        cache itself is touched under the lock; metadata is read outside it.
+
+        Args:
+            path_keys: Unique identifiers for the log sources
+
+        Returns:
+            Fields per path key, from metadata or falling back to the path key
+        """
+        path_keys = list(path_keys)
+        revision = self._settings.get_log_metadata_revision()
+        with self._lock:
+            if revision != self._fields_revision:
+                self._fields_cache = {}
+                self._fields_revision = revision
+            cache = self._fields_cache
+            fields = {p: cache[p] for p in path_keys if p in cache}
+            missing = [p for p in path_keys if p not in cache]
+
+        if not missing:
+            return fields
+
+        all_metadata = self._settings.get_all_log_metadata()
+        built = {}
+        for path_key in missing:
+            metadata = all_metadata.get(path_key) or {}
+            built[path_key] = {
+                "id": metadata.get("id", path_key),
+                "description": metadata.get("description", path_key),
+                "path": path_key,
+            }
+
+        with self._lock:
+            # Don't store fields built from metadata a newer revision replaced
+            if self._fields_revision == revision:
+                self._fields_cache.update(built)
+
+        fields.update(built)
+        return fields
+
+    def _resolve_log_id(self, log_id: str, id_paths: list[str]) -> str | None:
+        """Find the subscribed log for an ID (call with lock held).
+
+        Args:
+            log_id: Log ID (from metadata) or path_key
+            id_paths: Path keys whose metadata uses log_id, from _paths_for_id
+
+        Returns:
+            Path key of the subscribed log, or None if not found
+        """
+        # First try to find by ID in metadata, then as a path_key
+        return next(
+            (p for p in id_paths if p in self._subscribed_paths),
+            log_id if log_id in self._subscribed_paths else None,
+        )
+
+    def _paths_for_id(self, log_id: str) -> list[str]:
+        """Look up the path keys whose metadata uses a log ID.
+
+        Args:
+            log_id: Log ID from metadata
+
+        Returns:
+            Matching path keys, in metadata order
+        """
+        revision = self._settings.get_log_metadata_revision()
+        with self._lock:
+            if revision == self._id_index_revision:
+                return self._id_index.get(log_id, [])
+
+        # Rebuild from settings outside the lock; only the swap is guarded
+        index: dict[str, list[str]] = {}
+        for path_key, metadata in self._settings.get_all_log_metadata().items():
+            index.setdefault(metadata.get("id"), []).append(path_key)
+
+        with self._lock:
+            self._id_index = index
+            self._id_index_revision = revision
+        return index.get(log_id, [])
 
     def register_update_callback(self, callback: Callable[[str, str], None]) -> None:
         """Register a callback to be notified of log updates.
@@ -166,7 +314,7 @@ class McpBridge(LogSubscriber):
         """
         with self._lock:
             if callback not in self._update_callbacks:
-                self._update_callbacks.append(callback)
+                self._update_callbacks = (*self._update_callbacks, callback)
 
     def unregister_update_callback(self, callback: Callable[[str, str], None]) -> None:
         """Unregister an update callback.
@@ -176,7 +324,9 @@ class McpBridge(LogSubscriber):
         """
         with self._lock:
             if callback in self._update_callbacks:
-                self._update_callbacks.remove(callback)
+                self._update_callbacks = tuple(
+                    cb for cb in self._update_callbacks if cb != callback
+                )
 
     # LogSubscriber Protocol Implementation
 
@@ -187,20 +337,33 @@ class McpBridge(LogSubscriber):
             path: Log file path
             content: New content to append
         """
-        with self._lock:
-            if path in self._log_cache:
-                self._log_cache[path] += content
-            else:
-                self._log_cache[path] = content
+        # Lock-free reject for content still in flight after an unsubscribe;
+        # dict membership reads are atomic
+        if path not in self._log_cache:
+            return
 
-            # Notify callbacks
-            callbacks = self._update_callbacks.copy()
+        with self._lock:
+            lines = self._log_cache.get(path)
+            if lines is None:
+                return
+            new_lines = _LINE_RE.findall(content)
+            # Chunks may split a line; finish the previous partial line first
+            if new_lines and lines and not lines[-1].endswith("\n"):
+                new_lines[0] = lines.pop() + new_lines[0]
+            lines.extend(new_lines)
+            self._joined_cache.pop(path, None)
+
+        # Reading the tuple is atomic; nothing to do until the server attaches
+        callbacks = self._update_callbacks
+        if not callbacks:
+            return
 
+        # Notify callbacks
         for callback in callbacks:
             try:
                 callback(path, content)
             except Exception as e:
-                logger.error(f"Error in update callback: {e}", exc_info=True)
+                logger.error("Error in update callback: %s", e, exc_info=True)
 
     def on_log_cleared(self, path: str) -> None:
         """Called when log buffer is cleared.
@@ -209,9 +372,11 @@ class McpBridge(LogSubscriber):
             path: Log file path
         """
         with self._lock:
-            if path in self._log_cache:
-                self._log_cache[path] = ""
-        logger.info(f"MCP Bridge cleared cache for: {path}")
+            lines = self._log_cache.get(path)
+            if lines is not None:
+                lines.clear()
+            self._joined_cache.pop(path, None)
+        logger.info("MCP Bridge cleared cache for: %s", path)
 
     def on_stream_interrupted(self, path: str, reason: str) -> None:
         """Called when the log stream is interrupted.
@@ -220,7 +385,7 @@ class McpBridge(LogSubscriber):
             path: Log file path
             reason: Reason for interruption
         """
-        logger.info(f"MCP Bridge: Stream interrupted for {path} - {reason}")
+        logger.info("MCP Bridge: Stream interrupted for %s - %s", path, reason)
 
     def on_stream_resumed(self, path: str) -> None:
         """Called when the log stream resumes.
@@ -228,7 +393,7 @@ class McpBridge(LogSubscriber):
         Args:
             path: Log file path
         """
-        logger.info(f"MCP Bridge: Stream resumed for {path}")
+        logger.info("MCP Bridge: Stream resumed for %s", path)
 
     def set_group_windows_callback(
         self, callback: Callable[[], dict[str, "LogGroupWindow"]]
@@ -250,14 +415,26 @@ class McpBridge(LogSubscriber):
         Returns:
             Last N lines as string, or None if log not found
         """
-        log_info = self.get_log_info(log_id)
-        if log_info is None:
-            return None
+        id_paths = self._paths_for_id(log_id)
+        with self._lock:
+            path_key = self._resolve_log_id(log_id, id_paths)
+            if path_key is None:
+                return None
+            return self._cached_tail(path_key, num_lines)
+
+    def _cached_tail(self, path_key: str, num_lines: int) -> str:
+        """Join the last lines of a subscribed log (call with lock held).
 
-        content = log_info["content"]
-        lines = content.split("\n")
-        last_lines = lines[-num_lines:] if len(lines) > num_lines else lines
-        return "\n".join(last_lines)
+        Args:
+            path_key: Unique identifier for the log source
+            num_lines: Number of lines to retrieve
+
+        Returns:
+            Last num_lines lines as one string
+        """
+        # Walk back from the end so the cost depends on num_lines only
+        tail = list(islice(reversed(self._log_cache[path_key]), num_lines))
+        return "".join(reversed(tail))
 
     def get_groups(self) -> dict[str, dict[str, Any]]:
         """Get all log groups with their metadata.
@@ -265,26 +442,26 @@ class McpBridge(LogSubscriber):
         Returns:
             Dictionary mapping group_name to group info
         """
-        with self._lock:
-            result: dict[str, dict[str, Any]] = {}
-            log_groups = self._settings.get_log_groups()
-
-            # Group logs by their group name
-            groups: dict[str, list[str]] = {}
-            for path_key, group_name in log_groups.items():
-                if group_name not in groups:
-                    groups[group_name] = []
-                groups[group_name].append(path_key)
-
-            for group_name, paths in groups.items():
-                result[group_name] = {
-                    "name": group_name,
-                    "log_count": len(paths),
-                    "logs": paths,
-                    "has_combined_view": self._has_combined_view(group_name),
-                }
-
-            return result
+        # Reads only settings and group windows, so the cache lock isn't needed
+        result: dict[str, dict[str, Any]] = {}
+        log_groups = self._settings.get_log_groups()
+
+        # Group logs by their group name
+        groups: dict[str, list[str]] = {}
+        for path_key, group_name in log_groups.items():
+            if group_name not in groups:
+                groups[group_name] = []
+            groups[group_name].append(path_key)
+
+        for group_name, paths in groups.items():
+            result[group_name] = {
+                "name": group_name,
+                "log_count": len(paths),
+                "logs": paths,
+                "has_combined_view": self._has_combined_view(group_name),
+            }
+
+        return result
 
     def _has_combined_view(self, group_name: str) -> bool:
         """Check if a group has an active combined view with content.
@@ -295,20 +472,30 @@ class McpBridge(LogSubscriber):
         Returns:
             True if combined view exists and has content
         """
+        controller = self._combined_controller(group_name)
+        return controller is not None and controller.has_nonblank_content()
+
+    def _combined_controller(self, group_name: str) -> "ContentController | None":
+        """Find the controller of a group's active combined view.
+
+        Args:
+            group_name: Name of the group
+
+        Returns:
+            Combined view controller, or None if the group has none showing
+        """
         if not self._group_windows_callback:
-            return False
+            return None
 
         try:
-            group_windows = self._group_windows_callback()
-            if group_name in group_windows:
-                window = group_windows[group_name]
-                if window._mode == "combined" and window._combined_controller:
-                    content = window._combined_controller.get_text()
-                    return bool(content and content.strip())
+            window = self._group_windows_callback().get(group_name)
         except Exception as e:
-            logger.warning(f"Error checking combined view for {group_name}: {e}")
+            logger.warning("Error getting combined view for %s: %s", group_name, e)
+            return None
 
-        return False
+        if window is not None and window._mode == "combined":
+            return window._combined_controller
+        return None
 
     def get_combined_view_content(self, group_name: str) -> str | None:
         """Get the combined view content for a group.
@@ -319,19 +506,8 @@ class McpBridge(LogSubscriber):
         Returns:
             Combined view content or None if not available
         """
-        if not self._group_windows_callback:
-            return None
-
-        try:
-            group_windows = self._group_windows_callback()
-            if group_name in group_windows:
-                window = group_windows[group_name]
-                if window._mode == "combined" and window._combined_controller:
-                    return window._combined_controller.get_text()
-        except Exception as e:
-            logger.warning(f"Error getting combined view for {group_name}: {e}")
-
-        return None
+        controller = self._combined_controller(group_name)
+        return controller.get_text() if controller is not None else None
 
     def get_combined_view_last_n_lines(
         self, group_name: str, num_lines: int
@@ -345,13 +521,8 @@ class McpBridge(LogSubscriber):
         Returns:
             Last N lines or None if not available
         """
-        content = self.get_combined_view_content(group_name)
-        if content is None:
-            return None
-
-        lines = content.split("\n")
-        last_lines = lines[-num_lines:] if len(lines) > num_lines else lines
-        return "\n".join(last_lines)
+        controller = self._combined_controller(group_name)
+        return controller.get_last_lines(num_lines) if controller is not None else None
 
     def get_group_content(
         self, group_name: str, num_lines: int | None = None
@@ -365,44 +536,53 @@ class McpBridge(LogSubscriber):
         Returns:
             Dictionary with content info or None if group not found
         """
-        groups = self.get_groups()
-        if group_name not in groups:
+        # Only this group's logs are needed; skip building every group's info
+        paths = [
+            path_key
+            for path_key, group in self._settings.get_log_groups().items()
+            if group == group_name
+        ]
+        if not paths:
             return None
 
-        group_info = groups[group_name]
-
         # Check if combined view has content - prioritize it
-        if group_info["has_combined_view"]:
-            if num_lines:
-                content = self.get_combined_view_last_n_lines(group_name, num_lines)
-            else:
-                content = self.get_combined_view_content(group_name)
-
-            if content and content.strip():
-                return {
-                    "group_name": group_name,
-                    "source": "combined_view",
-                    "content": content,
-                    "log_count": group_info["log_count"],
-                }
-
-        # Fall back to concatenating individual log content
-        combined_content = []
-        for path_key in group_info["logs"]:
-            if num_lines:
-                log_content = self.get_last_n_lines(path_key, num_lines)
-            else:
-                log_info = self.get_log_info(path_key)
-                log_content = log_info["content"] if log_info else None
-
-            if log_content:
-                metadata = self._settings.get_log_metadata(path_key)
-                desc = metadata.get("description", path_key) if metadata else path_key
-                combined_content.append(f"=== {desc} ===\n{log_content}")
+        if num_lines:
+            content = self.get_combined_view_last_n_lines(group_name, num_lines)
+        else:
+            content = self.get_combined_view_content(group_name)
+
+        if content and content.strip():
+            return {
+                "group_name": group_name,
+                "source": "combined_view",
+                "content": content,
+                "log_count": len(paths),
+            }
+
+        # Fall back to concatenating individual log content, snapshotting
+        # every log in the group under one lock acquisition
+        with self._lock:
+            contents = [
+                (
+                    path_key,
+                    self._cached_tail(path_key, num_lines)
+                    if num_lines
+                    else self._cached_content(path_key),
+                )
+                for path_key in paths
+                if path_key in self._subscribed_paths
+            ]
+
+        fields = self._log_fields(path_key for path_key, _ in contents)
+        combined_content = [
+            f"=== {fields[path_key]['description']} ===\n{log_content}"
+            for path_key, log_content in contents
+            if log_content
+        ]
 
         return {
             "group_name": group_name,
             "source": "individual_logs",
             "content": "\n\n".join(combined_content),
-            "log_count": group_info["log_count"],
+            "log_count": len(paths),
         }
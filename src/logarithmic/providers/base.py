@@ -144,6 +144,10 @@ class LogProvider(QObject, metaclass=QABCMeta):
 
     error_occurred = Signal(str)
 
+    # Whether the background thread can sit in a read that stop() cannot
+    # interrupt; routine stops only signal such providers instead of waiting
+    blocks_on_stop: bool = False
+
     def __init__(
         self, config: ProviderConfig, log_manager: "LogManager", path_key: str
     ) -> None:
@@ -176,6 +180,21 @@ class LogProvider(QObject, metaclass=QABCMeta):
         """Stop the provider and clean up resources."""
         pass
 
+    def wait(self, timeout_ms: int = 5000) -> bool:
+        """Wait for background work started by the provider to finish.
+
+        ``stop()`` only signals shutdown, so callers stopping several
+        providers can signal all of them first and then wait, letting the
+        threads wind down concurrently.
+
+        Args:
+            timeout_ms: Timeout in milliseconds
+
+        Returns:
+            True if finished, False if timeout
+        """
+        return True
+
     @abstractmethod
     def pause(self) -> None:
         """Pause log reading (but maintain connection)."""
@@ -99,12 +99,25 @@ class FileProvider(LogProvider):
 
         if self._watcher:
             self._watcher.stop()
-            self._watcher.wait(5000)  # Wait up to 5 seconds
-            self._watcher = None
 
         self._running = False
         logger.info(f"FileProvider stopped for {self._path_key}")
 
+    def wait(self, timeout_ms: int = 5000) -> bool:
+        """Wait for the watcher thread to finish.
+
+        Args:
+            timeout_ms: Timeout in milliseconds
+
+        Returns:
+            True if thread finished, False if timeout
+        """
+        if self._watcher:
+            if not self._watcher.wait(timeout_ms):
+                return False
+            self._watcher = None
+        return True
+
     def pause(self) -> None:
         """Pause reading the file."""
         if self._watcher:
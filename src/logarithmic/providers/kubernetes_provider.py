@@ -415,6 +415,9 @@ class KubernetesProvider(LogProvider):
     - is_deployment: Whether this is tracking a deployment (wildcard)
     """
 
+    # The streamer is usually blocked in a socket read of the log stream
+    blocks_on_stop = True
+
     def __init__(
         self, config: ProviderConfig, log_manager: "LogManager", path_key: str
     ) -> None:
@@ -469,9 +472,8 @@ class KubernetesProvider(LogProvider):
             kubeconfig_path=self._kubeconfig_path,
         )
 
-        self._streamer.new_lines.connect(
-            lambda text: None
-        )  # Already published to log manager
+        # Lines are published to the log manager directly; new_lines is left
+        # unconnected so each line doesn't queue a no-op call on the GUI thread
         self._streamer.error_occurred.connect(self._on_error)
         self._streamer.start()
 
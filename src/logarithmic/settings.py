@@ -2,6 +2,9 @@
 
 import json
 import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +15,8 @@ class Settings:
     """Manages application settings persistence.
 
     Settings are stored in a JSON file in the user's home directory.
+    Session files are written on a background thread; call flush() to wait
+    for queued writes to reach disk.
     """
 
     def __init__(self) -> None:
@@ -21,6 +26,17 @@ class Settings:
         self.app_settings_file = self.settings_dir / "app_settings.json"
         self._current_session = "default"
         self._data: dict[str, Any] = {}
+        # Bumped whenever log metadata may have changed, for reader caches
+        self._metadata_revision = 0
+
+        # Background session writer; queued writes to one file coalesce
+        self._writer: ThreadPoolExecutor | None = None
+        self._write_lock = threading.Lock()
+        self._pending_writes: dict[Path, str] = {}
+        # Text last queued per session file; identical saves are skipped
+        self._saved_text: dict[Path, str] = {}
+        self._last_write: Future | None = None
+
         self._ensure_directories()
         self._load_last_session()
         self._load()
@@ -53,6 +69,9 @@ class Settings:
 
     def _load(self) -> None:
         """Load settings from disk (loads current session)."""
+        # Read back any write still queued for this session
+        self.flush()
+        self._metadata_revision += 1
         session_file = self.sessions_dir / f"{self._current_session}.json"
 
         if not session_file.exists():
@@ -84,6 +103,7 @@ class Settings:
                     "enabled": False,
                     "binding_address": "127.0.0.1",
                     "port": 3000,
+                    "max_cached_lines": 10000,  # Lines kept per log for MCP
                 },
                 "log_metadata": {},  # path_key -> {id, description} mapping
                 "provider_configs": {},  # path_key -> provider config (e.g., kubeconfig_path)
@@ -119,14 +139,66 @@ class Settings:
             self._data = {"open_windows": [], "window_positions": {}}
 
     def _save(self) -> None:
-        """Save settings to disk (saves to current session)."""
+        """Save settings to disk (saves to current session).
+
+        The data is serialized on the calling thread and written to disk by
+        the background writer.
+        """
         session_file = self.sessions_dir / f"{self._current_session}.json"
 
         try:
-            with open(session_file, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2)
+            text = json.dumps(self._data, indent=2)
         except Exception as e:
             logger.error(f"Failed to save session '{self._current_session}': {e}")
+            return
+
+        with self._write_lock:
+            # Nothing changed since the last save of this file
+            if self._saved_text.get(session_file) == text:
+                return
+            self._saved_text[session_file] = text
+
+            # A write already queued for this file picks up the newer text
+            queued = session_file in self._pending_writes
+            self._pending_writes[session_file] = text
+
+        if not queued:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="settings-writer"
+                )
+            self._last_write = self._writer.submit(self._write_pending, session_file)
+
+    def _write_pending(self, session_file: Path) -> None:
+        """Write the latest queued text for a session file (writer thread).
+
+        Args:
+            session_file: Session file to write
+        """
+        with self._write_lock:
+            text = self._pending_writes.pop(session_file, None)
+        if text is None:
+            return
+
+        try:
+            with open(session_file, "w", encoding="utf-8") as f:
+                f.write(text)
+        except Exception as e:
+            logger.error(f"Failed to save session '{session_file.stem}': {e}")
+            # Let the next save retry instead of treating the text as saved
+            with self._write_lock:
+                if self._saved_text.get(session_file) == text:
+                    del self._saved_text[session_file]
+
+    def save(self) -> None:
+        """Save the current session to disk if it changed since the last save."""
+        self._save()
+
+    def flush(self) -> None:
+        """Block until every queued session write has reached disk."""
+        last_write = self._last_write
+        if last_write is not None:
+            last_write.result()
 
     def get_tracked_logs(self) -> list[str]:
         """Get list of tracked log file paths.
@@ -186,6 +258,9 @@ class Settings:
         Args:
             paths: List of file paths as strings
         """
+        # Open/close bursts often settle back on the same list
+        if self._data.get("open_windows") == paths:
+            return
         self._data["open_windows"] = paths
         self._save()
 
@@ -327,6 +402,8 @@ class Settings:
         if not self.sessions_dir.exists():
             return ["default"]
 
+        # A session saved just now may still be queued for writing
+        self.flush()
         sessions = []
         for file in self.sessions_dir.glob("*.json"):
             sessions.append(file.stem)
@@ -371,7 +448,11 @@ class Settings:
             logger.warning(f"Cannot delete current session '{session_name}'")
             return False
 
+        # Don't let a queued write recreate the file after it is deleted
+        self.flush()
         session_file = self.sessions_dir / f"{session_name}.json"
+        with self._write_lock:
+            self._saved_text.pop(session_file, None)
         if session_file.exists():
             session_file.unlink()
             logger.info(f"Deleted session '{session_name}'")
@@ -426,9 +507,18 @@ class Settings:
             element: Element name (log_content, ui_elements, status_bar)
             size: Font size in points
         """
+        self.set_font_sizes({element: size})
+
+    def set_font_sizes(self, sizes: dict[str, int]) -> None:
+        """Set font sizes for several elements with a single write.
+
+        Args:
+            sizes: Mapping of element name (log_content, ui_elements,
+                status_bar) to font size in points
+        """
         if "font_sizes" not in self._data:
             self._data["font_sizes"] = {}
-        self._data["font_sizes"][element] = size
+        self._data["font_sizes"].update(sizes)
         self._save()
 
     def get_theme_colors(self) -> dict[str, str]:
@@ -549,6 +639,7 @@ class Settings:
             "id": log_id,
             "description": description,
         }
+        self._metadata_revision += 1
         self._save()
 
     def remove_log_metadata(self, path_key: str) -> None:
@@ -559,6 +650,7 @@ class Settings:
         """
         if "log_metadata" in self._data and path_key in self._data["log_metadata"]:
             del self._data["log_metadata"][path_key]
+            self._metadata_revision += 1
             self._save()
 
     def get_all_log_metadata(self) -> dict[str, dict[str, str]]:
@@ -570,6 +662,14 @@ class Settings:
         result = self._data.get("log_metadata", {})
         return dict(result) if isinstance(result, dict) else {}
 
+    def get_log_metadata_revision(self) -> int:
+        """Get a counter that changes whenever log metadata may have changed.
+
+        Returns:
+            Revision number; compare with a stored value to detect changes
+        """
+        return self._metadata_revision
+
     def get_provider_config(self, path_key: str) -> dict | None:
         """Get provider configuration for a log source.
 
@@ -0,0 +1,36 @@
+"""Tests for the file provider."""
+
+from pathlib import Path
+
+from logarithmic.log_manager import LogManager
+from logarithmic.providers.file_provider import FileProvider
+
+
+def test_stop_then_wait_finishes_watcher(qtbot, tmp_path: Path) -> None:
+    """Test that stop() only signals and wait() joins the watcher thread."""
+    log_file = tmp_path / "test.log"
+    log_file.write_text("line 1\n")
+
+    log_manager = LogManager()
+    log_manager.register_log(str(log_file))
+    config = FileProvider.create_config(str(log_file))
+    provider = FileProvider(config, log_manager, str(log_file))
+
+    provider.start()
+    assert provider.is_running()
+    qtbot.waitUntil(lambda: provider._watcher._running, timeout=2000)
+
+    provider.stop()
+    assert not provider.is_running()
+
+    assert provider.wait(5000) is True
+    assert provider._watcher is None
+
+
+def test_wait_without_start_returns_immediately(tmp_path: Path) -> None:
+    """Test that wait() on a provider that never started returns True."""
+    log_file = tmp_path / "test.log"
+    config = FileProvider.create_config(str(log_file))
+    provider = FileProvider(config, LogManager(), str(log_file))
+
+    assert provider.wait(100) is True
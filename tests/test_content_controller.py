@@ -161,3 +161,31 @@ class TestContentControllerState:
         assert controller._filter_case_insensitive is True
         assert controller._filtered_line_count == 0
         assert controller._full_content == ""
+
+    def test_get_last_lines(self) -> None:
+        """Test tail retrieval matches splitting the content on newlines."""
+        from logarithmic.content_controller import ContentController
+        from logarithmic.fonts import FontManager
+
+        fonts = MagicMock(spec=FontManager)
+        controller = ContentController(fonts, "test.log")
+
+        for content in ("a\nb\nc\n", "a\nb\nc", "", "single"):
+            controller._full_content = content
+            for num_lines in (1, 2, 3, 10):
+                expected = "\n".join(content.split("\n")[-num_lines:])
+                assert controller.get_last_lines(num_lines) == expected
+
+    def test_has_nonblank_content(self) -> None:
+        """Test that whitespace-only content counts as blank."""
+        from logarithmic.content_controller import ContentController
+        from logarithmic.fonts import FontManager
+
+        fonts = MagicMock(spec=FontManager)
+        controller = ContentController(fonts, "test.log")
+
+        assert controller.has_nonblank_content() is False
+        controller._full_content = " \n\t\n"
+        assert controller.has_nonblank_content() is False
+        controller._full_content = "\n line\n"
+        assert controller.has_nonblank_content() is True
@@ -0,0 +1,18 @@
+"""Tests for the log group window."""
+
+from logarithmic.log_group_window import LogGroupWindow
+
+
+def test_remove_log_removes_its_own_tab(qtbot) -> None:
+    """Test that removing a log drops its tab even when titles collide."""
+    window = LogGroupWindow("group", initial_mode="tabbed")
+    qtbot.addWidget(window)
+
+    window.add_log("/var/a/app.log")
+    window.add_log("/var/b/app.log")
+    kept_page = window._tab_widgets["/var/a/app.log"]["widget"]
+
+    window.remove_log("/var/b/app.log")
+
+    assert window.tab_widget.count() == 1
+    assert window.tab_widget.widget(0) is kept_page
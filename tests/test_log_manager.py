@@ -63,6 +63,25 @@ def test_log_manager_unsubscribe() -> None:
     assert len(subscriber.content_calls) == 0
 
 
+def test_log_manager_subscribe_many() -> None:
+    """Test subscribing to several logs at once replays their buffers."""
+    manager = LogManager()
+    subscriber = MockSubscriber()
+
+    manager.register_log("a.log")
+    manager.register_log("b.log")
+    manager.publish_content("a.log", "A content")
+
+    manager.subscribe_many(["a.log", "b.log", "missing.log"], subscriber)
+    # Subscribing again is a no-op
+    manager.subscribe_many(["a.log"], subscriber)
+
+    assert subscriber.content_calls == [("a.log", "A content")]
+
+    manager.publish_content("b.log", "B content")
+    assert subscriber.content_calls[-1] == ("b.log", "B content")
+
+
 def test_log_manager_multiple_subscribers() -> None:
     """Test multiple subscribers to the same log."""
     manager = LogManager()
@@ -138,3 +157,103 @@ def test_log_manager_subscriber_error_handling() -> None:
     manager.publish_content("test.log", "Test content")
 
     assert len(good_subscriber.content_calls) == 1
+
+
+def test_log_manager_duplicate_subscribe_is_noop() -> None:
+    """Test that subscribing twice neither replays nor double-delivers."""
+    manager = LogManager()
+    subscriber = MockSubscriber()
+
+    manager.register_log("test.log")
+    manager.publish_content("test.log", "Buffered")
+    manager.subscribe("test.log", subscriber)
+    manager.subscribe("test.log", subscriber)
+
+    assert subscriber.content_calls == [("test.log", "Buffered")]
+
+    manager.publish_content("test.log", "Live")
+    assert subscriber.content_calls[-1] == ("test.log", "Live")
+    assert len(subscriber.content_calls) == 2
+
+
+def test_log_manager_subscribe_replays_outside_lock() -> None:
+    """Test that subscribe replays the buffer after releasing the lock."""
+    manager = LogManager()
+    subscriber = MockSubscriber()
+    held = []
+    subscriber.on_log_content = lambda path, content: held.append(
+        manager._lock._is_owned()
+    )
+
+    manager.register_log("test.log")
+    manager.publish_content("test.log", "Buffered")
+    manager.subscribe("test.log", subscriber)
+
+    assert held == [False]
+    assert manager._subscriptions[subscriber] == {"test.log"}
+
+    manager.unsubscribe("test.log", subscriber)
+    assert subscriber not in manager._subscriptions
+
+
+def test_log_manager_first_content_signal(qtbot) -> None:
+    """Test that first content is signalled once per empty -> non-empty change."""
+    manager = LogManager()
+    manager.register_log("test.log")
+
+    with qtbot.waitSignal(manager.first_content_available) as blocker:
+        manager.publish_content("test.log", "Line 1\n")
+    assert blocker.args == ["test.log"]
+
+    with qtbot.assertNotEmitted(manager.first_content_available):
+        manager.publish_content("test.log", "Line 2\n")
+
+    manager.clear_buffer("test.log")
+    assert not manager.has_content("test.log")
+    with qtbot.waitSignal(manager.first_content_available):
+        manager.publish_content("test.log", "Line 3\n")
+    assert manager.has_content("test.log")
+
+
+def test_log_manager_unsubscribe_many() -> None:
+    """Test removing several subscriptions in one call."""
+    manager = LogManager()
+    viewer = MockSubscriber()
+    group = MockSubscriber()
+
+    manager.register_log("a.log")
+    manager.register_log("b.log")
+    manager.subscribe("a.log", viewer)
+    manager.subscribe("a.log", group)
+    manager.subscribe("b.log", group)
+
+    manager.unsubscribe_many(
+        [("a.log", viewer), ("a.log", group), ("b.log", group), ("c.log", group)]
+    )
+
+    manager.publish_content("a.log", "A")
+    manager.publish_content("b.log", "B")
+    assert viewer.content_calls == []
+    assert group.content_calls == []
+
+
+def test_log_manager_unsubscribe_subscriber() -> None:
+    """Test removing a subscriber from every log it follows."""
+    manager = LogManager()
+    group = MockSubscriber()
+    other = MockSubscriber()
+
+    for path in ("a.log", "b.log", "c.log"):
+        manager.register_log(path)
+    manager.subscribe_many(["a.log", "b.log", "c.log"], group)
+    manager.subscribe("a.log", other)
+    manager.unregister_log("c.log")
+
+    manager.unsubscribe_subscriber(group)
+    manager.unsubscribe_subscriber(group)
+
+    manager.publish_content("a.log", "A")
+    manager.publish_content("b.log", "B")
+    assert group.content_calls == []
+    assert other.content_calls == [("a.log", "A")]
+    assert group not in manager._subscriptions
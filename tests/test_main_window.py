@@ -0,0 +1,643 @@
+"""Tests for main window log and window management."""
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QMimeData
+from PySide6.QtCore import QPointF
+from PySide6.QtCore import Qt
+from PySide6.QtCore import QUrl
+from PySide6.QtGui import QDropEvent
+from PySide6.QtWidgets import QComboBox
+from PySide6.QtWidgets import QMessageBox
+from PySide6.QtWidgets import QPushButton
+
+from logarithmic.exceptions import FileAccessError
+from logarithmic.main_window import MainWindow
+from logarithmic.main_window import TrackingModeDialog
+from logarithmic.main_window import _drop_path_kind
+from logarithmic.main_window import _parent_dir_exists
+
+
+@pytest.fixture
+def main_window(qtbot, mock_settings):
+    """Create a MainWindow instance for testing.
+
+    Mocks background operations (version checker, MCP server, shutdown dialog)
+    to prevent hangs in CI environments.
+    """
+    with (
+        patch("logarithmic.main_window.VersionChecker") as mock_checker,
+        patch("logarithmic.main_window.LogarithmicMcpServer"),
+        patch("logarithmic.main_window.ShutdownDialog"),
+    ):
+        mock_checker.return_value = MagicMock()
+
+        window = MainWindow()
+        qtbot.addWidget(window)
+        yield window
+
+        window.close()
+
+
+def test_auto_open_batches_ready_windows(main_window, qtbot) -> None:
+    """Test that restored logs are opened together in one deferred pass."""
+    paths = ["a.log", "b.log"]
+    for path in paths:
+        main_window._log_manager.register_log(path)
+        main_window._providers[path] = MagicMock()
+        main_window._pending_window_opens.add(path)
+
+    with patch.object(main_window, "_open_log_viewer") as mock_open:
+        for path in paths:
+            main_window._log_manager.publish_content(path, "line\n")
+
+        # Nothing opens until the batch timer fires
+        mock_open.assert_not_called()
+        assert main_window._ready_to_open == set(paths)
+
+        qtbot.waitUntil(lambda: mock_open.call_count == 2, timeout=2000)
+
+    assert not main_window._ready_to_open
+    assert not main_window._pending_window_opens
+    main_window._providers.clear()
+
+
+def test_other_viewers_tracks_open_windows(main_window, qtbot) -> None:
+    """Test that the other-viewers list follows windows opening and closing."""
+    for path in ("a.log", "b.log"):
+        main_window._log_manager.register_log(path)
+        main_window._open_log_viewer(path)
+
+    viewer_a = main_window._viewer_windows["a.log"]
+    viewer_b = main_window._viewer_windows["b.log"]
+    assert main_window._other_viewers(viewer_a) == [viewer_b]
+
+    viewer_b.close()
+    qtbot.waitUntil(lambda: "b.log" not in main_window._viewer_windows, timeout=2000)
+
+    assert main_window._viewer_list == [viewer_a]
+    assert main_window._other_viewers(viewer_a) == []
+
+
+def test_reset_windows_sets_geometry_once_per_window(main_window) -> None:
+    """Test that reset windows cascades with a single geometry call each."""
+    viewer = MagicMock()
+    group_window = MagicMock()
+    main_window._viewer_windows["a.log"] = viewer
+    main_window._group_windows["group"] = group_window
+
+    main_window._on_reset_windows()
+
+    pos = main_window.pos()
+    viewer.setGeometry.assert_called_once_with(pos.x() + 50, pos.y() + 50, 800, 600)
+    group_window.setGeometry.assert_called_once_with(
+        pos.x() + 80, pos.y() + 80, 800, 600
+    )
+    viewer.move.assert_not_called()
+    viewer.resize.assert_not_called()
+
+    main_window._viewer_windows.clear()
+    main_window._group_windows.clear()
+
+
+def test_group_reverse_index_follows_assignments(main_window) -> None:
+    """Test that the group -> logs index stays in sync with assignments."""
+    main_window._available_groups["group"] = None
+
+    main_window._assign_to_group("a.log", "group")
+    main_window._assign_to_group("b.log", "group")
+    assert list(main_window._group_to_logs["group"]) == ["a.log", "b.log"]
+
+    main_window._unassign_from_group("a.log")
+    assert list(main_window._group_to_logs["group"]) == ["b.log"]
+
+    main_window._unassign_from_group("b.log")
+    assert "group" not in main_window._group_to_logs
+
+
+def test_save_open_windows_is_coalesced(main_window, qtbot) -> None:
+    """Test that rapid open-window saves collapse into a single write."""
+    with patch.object(main_window._settings, "set_open_windows") as mock_set:
+        for _ in range(5):
+            main_window._save_open_windows()
+
+        mock_set.assert_not_called()
+        qtbot.waitUntil(lambda: mock_set.call_count == 1, timeout=2000)
+
+
+def test_set_all_window_sizes_skips_windows_at_target(main_window) -> None:
+    """Test that windows already at the default size are not resized."""
+    width, height = main_window._settings.get_default_window_size()
+    at_target = MagicMock()
+    at_target.width.return_value = width
+    at_target.height.return_value = height
+    too_small = MagicMock()
+    too_small.width.return_value = 100
+    too_small.height.return_value = 100
+    main_window._viewer_windows["a.log"] = at_target
+    main_window._group_windows["group"] = too_small
+
+    main_window._on_set_all_window_sizes()
+
+    at_target.resize.assert_not_called()
+    too_small.resize.assert_called_once_with(width, height)
+
+    main_window._viewer_windows.clear()
+    main_window._group_windows.clear()
+
+
+def test_drop_path_kind_classifies_paths(tmp_path) -> None:
+    """Test that dropped paths are classified with a single stat."""
+    log_file = tmp_path / "app.log"
+    log_file.write_text("line\n")
+
+    assert _drop_path_kind(str(log_file)) == "file"
+    assert _drop_path_kind(str(tmp_path)) == "folder"
+    assert _drop_path_kind(str(tmp_path / "missing.log")) is None
+
+
+def test_add_log_from_dialog_skips_already_tracked(main_window, tmp_path) -> None:
+    """Test that adding an already tracked log does not register it again."""
+    path_key = str(tmp_path / "app.log")
+    existing = MagicMock()
+    main_window._providers[path_key] = existing
+    dialog = MagicMock(tracking_mode="dedicated", path=path_key)
+
+    with (
+        patch("logarithmic.main_window.QMessageBox.information") as mock_info,
+        patch.object(main_window._provider_registry, "create_provider") as mock_create,
+    ):
+        main_window._add_log_from_dialog(dialog)
+
+    mock_info.assert_called_once()
+    mock_create.assert_not_called()
+    assert main_window._providers[path_key] is existing
+    main_window._providers.clear()
+
+
+def test_remove_group_takes_its_list_row(main_window) -> None:
+    """Test that removing a group drops exactly its row from the list."""
+    for group_name in ("alpha", "beta", "gamma"):
+        main_window._available_groups[group_name] = None
+        main_window._add_group_to_list(group_name)
+
+    main_window._on_remove_group("beta")
+
+    remaining = [
+        main_window.groups_list.item(i).data(Qt.ItemDataRole.UserRole)
+        for i in range(main_window.groups_list.count())
+    ]
+    assert remaining == ["alpha", "gamma"]
+    assert list(main_window._group_items) == ["alpha", "gamma"]
+
+
+def test_remove_group_unassigns_only_its_logs(main_window) -> None:
+    """Test that removing a group unassigns just the logs in that group."""
+    main_window._available_groups.update(dict.fromkeys(["alpha", "beta"]))
+    main_window._assign_to_group("a.log", "alpha")
+    main_window._assign_to_group("b.log", "beta")
+
+    with patch(
+        "logarithmic.main_window.QMessageBox.question",
+        return_value=QMessageBox.StandardButton.Yes,
+    ):
+        main_window._on_remove_group("alpha")
+
+    assert main_window._log_groups == {"b.log": "beta"}
+    assert "alpha" not in main_window._group_to_logs
+
+
+def test_log_row_buttons_dispatch_by_path(main_window, qtbot) -> None:
+    """Test that row buttons act on the log stored on the clicked row."""
+    main_window._available_groups["group"] = None
+    main_window._sync_group_combo_items()
+    main_window._add_log_to_list("a.log")
+    main_window._add_log_to_list("b.log")
+
+    row = main_window.log_list.itemWidget(main_window.log_list.item(1))
+    assign_btn, refresh_btn, close_btn = row.findChildren(QPushButton)
+    row.findChild(QComboBox).setCurrentText("group")
+
+    with (
+        patch.object(main_window, "_on_assign_to_group") as mock_assign,
+        patch.object(main_window, "_on_refresh_log") as mock_refresh,
+        patch.object(main_window, "_on_unregister_log") as mock_unregister,
+    ):
+        qtbot.mouseClick(assign_btn, Qt.MouseButton.LeftButton)
+        qtbot.mouseClick(refresh_btn, Qt.MouseButton.LeftButton)
+        qtbot.mouseClick(close_btn, Qt.MouseButton.LeftButton)
+
+    mock_assign.assert_called_once_with("b.log", "group")
+    mock_refresh.assert_called_once_with("b.log")
+    mock_unregister.assert_called_once_with("b.log")
+
+
+def test_group_row_buttons_dispatch_by_group(main_window, qtbot) -> None:
+    """Test that group row buttons act on the group stored on the clicked row."""
+    main_window._add_group_to_list("alpha")
+    main_window._add_group_to_list("beta")
+
+    row = main_window.groups_list.itemWidget(main_window._group_items["beta"])
+    show_btn, remove_btn = row.findChildren(QPushButton)
+
+    with (
+        patch.object(main_window, "_on_show_group") as mock_show,
+        patch.object(main_window, "_on_remove_group") as mock_remove,
+    ):
+        qtbot.mouseClick(show_btn, Qt.MouseButton.LeftButton)
+        qtbot.mouseClick(remove_btn, Qt.MouseButton.LeftButton)
+
+    mock_show.assert_called_once_with("beta")
+    mock_remove.assert_called_once_with("beta")
+
+
+def test_session_restore_is_deferred(qtbot, mock_settings) -> None:
+    """Test that the session is restored after construction returns."""
+    with (
+        patch("logarithmic.main_window.VersionChecker"),
+        patch("logarithmic.main_window.LogarithmicMcpServer"),
+        patch("logarithmic.main_window.ShutdownDialog"),
+        patch.object(MainWindow, "_restore_session") as mock_restore,
+    ):
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        mock_restore.assert_not_called()
+        qtbot.waitUntil(lambda: mock_restore.call_count == 1, timeout=2000)
+
+        window.close()
+
+
+def test_font_size_clicks_are_debounced(main_window, qtbot) -> None:
+    """Test that repeated font size clicks apply only the final size."""
+    viewer = MagicMock()
+    main_window._viewer_windows["a.log"] = viewer
+    start = main_window._log_font_size
+
+    for _ in range(3):
+        main_window._change_log_font_size(1)
+
+    assert main_window.log_font_size_value.text() == f"{start + 3} pt"
+    viewer.set_log_font_size.assert_not_called()
+
+    qtbot.waitUntil(lambda: viewer.set_log_font_size.called, timeout=2000)
+    viewer.set_log_font_size.assert_called_once_with(start + 3)
+
+    # The write to the session follows once the save timer settles
+    qtbot.waitUntil(
+        lambda: main_window._settings.get_font_sizes()["log_content"] == start + 3,
+        timeout=2000,
+    )
+
+    main_window._viewer_windows.clear()
+
+
+def test_refresh_log_items_updates_rows_in_place(main_window) -> None:
+    """Test that refreshing log rows reuses their widgets."""
+    main_window._add_log_to_list("a.log")
+    row = main_window.log_list.itemWidget(main_window.log_list.item(0))
+
+    main_window._available_groups["group"] = None
+    main_window._sync_group_combo_items()
+    main_window._log_groups["a.log"] = "group"
+    main_window._refresh_all_log_items()
+
+    assert main_window.log_list.itemWidget(main_window.log_list.item(0)) is row
+    group_combo = row.findChild(QComboBox)
+    assert [group_combo.itemText(i) for i in range(group_combo.count())] == [
+        "(no group)",
+        "group",
+    ]
+    assert group_combo.currentText() == "group"
+
+
+def test_parent_dir_exists_checks_shared_dirs_once(tmp_path) -> None:
+    """Test that a per-pass cache stats each parent directory once."""
+    seen: dict[str, bool] = {}
+    paths = [str(tmp_path / "a.log"), str(tmp_path / "b.log")]
+
+    with patch(
+        "logarithmic.main_window.os.path.isdir", return_value=True
+    ) as mock_isdir:
+        assert all(_parent_dir_exists(path, seen) for path in paths)
+
+    mock_isdir.assert_called_once_with(str(tmp_path))
+
+
+def test_group_add_and_remove_update_row_combos(main_window) -> None:
+    """Test that adding and removing a group edits each row's dropdown."""
+    main_window._add_log_to_list("a.log")
+    group_combo = main_window.log_list.itemWidget(
+        main_window.log_list.item(0)
+    ).findChild(QComboBox)
+
+    with patch(
+        "logarithmic.main_window.QInputDialog.getText", return_value=("group", True)
+    ):
+        main_window._on_add_group()
+    assert group_combo.findText("group") == 1
+
+    group_combo.setCurrentIndex(1)
+    main_window._on_remove_group("group")
+    assert group_combo.count() == 1
+    assert group_combo.currentText() == "(no group)"
+
+
+def test_tracking_dialog_fills_pattern_once_per_switch(qtbot, tmp_path) -> None:
+    """Test that switching to wildcard mode suggests a pattern a single time."""
+    dialog = TrackingModeDialog(str(tmp_path / "app-20240101-120000.log"))
+    qtbot.addWidget(dialog)
+
+    with patch.object(
+        dialog.wildcard_input, "setText", wraps=dialog.wildcard_input.setText
+    ) as mock_set_text:
+        dialog.wildcard_radio.setChecked(True)
+
+    mock_set_text.assert_called_once_with("app-*.log")
+    assert dialog.wildcard_input.isEnabled()
+
+    dialog.dedicated_radio.setChecked(True)
+    assert not dialog.wildcard_input.isEnabled()
+
+
+def test_main_window_position_saves_are_coalesced(main_window, qtbot) -> None:
+    """Test that a burst of moves writes the main window position once."""
+    with patch.object(main_window._settings, "set_main_window_position") as mock_set:
+        for x in range(100, 150, 10):
+            main_window.move(x, 100)
+            main_window._save_main_window_position()
+
+        mock_set.assert_not_called()
+        qtbot.waitUntil(lambda: mock_set.call_count == 1, timeout=2000)
+
+
+def test_unregister_log_takes_its_list_row(main_window) -> None:
+    """Test that unregistering a log drops exactly its row from the list."""
+    for path in ("a.log", "b.log", "c.log"):
+        main_window._log_manager.register_log(path)
+        main_window._add_log_to_list(path)
+
+    main_window._on_unregister_log("b.log")
+
+    remaining = [
+        main_window.log_list.item(i).data(Qt.ItemDataRole.UserRole)
+        for i in range(main_window.log_list.count())
+    ]
+    assert remaining == ["a.log", "c.log"]
+    assert list(main_window._log_items) == ["a.log", "c.log"]
+
+
+def test_group_saves_are_coalesced(main_window, qtbot) -> None:
+    """Test that a burst of group assignments writes the groups once."""
+    main_window._available_groups["group"] = None
+
+    with (
+        patch.object(main_window._settings, "set_log_groups") as mock_set,
+        patch.object(main_window._settings, "set_groups") as mock_set_groups,
+    ):
+        for path in ("a.log", "b.log", "c.log"):
+            main_window._assign_to_group(path, "group")
+
+        mock_set.assert_not_called()
+        qtbot.waitUntil(lambda: mock_set.call_count == 1, timeout=2000)
+
+    # Assignments alone leave the group name list untouched
+    mock_set_groups.assert_not_called()
+
+
+def test_session_restore_runs_in_chunks(main_window, qtbot) -> None:
+    """Test that tracked logs are restored a chunk per tick, in order."""
+    paths = [f"/logs/{i}.log" for i in range(25)]
+    done = MagicMock()
+
+    with (
+        patch.object(main_window._settings, "get_tracked_logs", return_value=paths),
+        patch.object(main_window, "_restore_log") as mock_restore_log,
+    ):
+        main_window._restore_session(on_complete=done)
+
+        # Nothing is restored until the event loop runs
+        mock_restore_log.assert_not_called()
+        assert main_window._pending_window_opens >= set(paths)
+
+        main_window._restore_next_chunk()
+        assert mock_restore_log.call_count == 10
+        done.assert_not_called()
+
+        qtbot.waitUntil(lambda: done.called, timeout=2000)
+
+    assert [c.args[0] for c in mock_restore_log.call_args_list] == paths
+    done.assert_called_once_with()
+    main_window._pending_window_opens.clear()
+
+
+def test_shift_drop_aggregates_warnings_and_skips_dialog(main_window, tmp_path) -> None:
+    """Test that a Shift-drop warns once and tracks files without a dialog."""
+    log_file = tmp_path / "app.log"
+    log_file.write_text("line\n")
+    missing = [str(tmp_path / "gone1.log"), str(tmp_path / "gone2.log")]
+
+    mime = QMimeData()
+    mime.setUrls([QUrl.fromLocalFile(p) for p in [*missing, str(log_file)]])
+    event = QDropEvent(
+        QPointF(0, 0),
+        Qt.DropAction.CopyAction,
+        mime,
+        Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.ShiftModifier,
+    )
+
+    with (
+        patch.object(QMessageBox, "warning") as mock_warning,
+        patch("logarithmic.main_window.TrackingModeDialog") as mock_dialog,
+        patch.object(main_window, "_track_file_log") as mock_track,
+    ):
+        main_window.dropEvent(event)
+
+    mock_warning.assert_called_once()
+    assert all(p in mock_warning.call_args.args[2] for p in missing)
+    mock_dialog.assert_not_called()
+    mock_track.assert_called_once_with(str(log_file), is_wildcard=False)
+
+
+def test_shift_drop_reports_tracking_errors_in_one_warning(
+    main_window, tmp_path
+) -> None:
+    """Test that files failing to track during a Shift-drop share one warning."""
+    files = [tmp_path / "a.log", tmp_path / "b.log"]
+    for log_file in files:
+        log_file.write_text("line\n")
+    missing = str(tmp_path / "gone.log")
+
+    mime = QMimeData()
+    mime.setUrls([QUrl.fromLocalFile(p) for p in [missing, *map(str, files)]])
+    event = QDropEvent(
+        QPointF(0, 0),
+        Qt.DropAction.CopyAction,
+        mime,
+        Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.ShiftModifier,
+    )
+
+    with (
+        patch.object(QMessageBox, "warning") as mock_warning,
+        patch.object(QMessageBox, "critical") as mock_critical,
+        patch.object(
+            main_window, "_track_file_log", side_effect=FileAccessError("denied")
+        ),
+    ):
+        main_window.dropEvent(event)
+
+    mock_critical.assert_not_called()
+    mock_warning.assert_called_once()
+    text = mock_warning.call_args.args[2]
+    assert missing in text
+    assert all(f"{log_file}: denied" in text for log_file in files)
+
+
+def test_font_sizes_saved_in_one_write(main_window, qtbot) -> None:
+    """Test that font changes to several elements share one settings write."""
+    viewer = MagicMock()
+    main_window._viewer_windows["a.log"] = viewer
+
+    with patch.object(main_window._settings, "set_font_sizes") as mock_set:
+        main_window._change_log_font_size(1)
+        main_window._change_status_font_size(1)
+
+        qtbot.waitUntil(lambda: mock_set.called, timeout=2000)
+
+    mock_set.assert_called_once_with(
+        {
+            "log_content": main_window._log_font_size,
+            "status_bar": main_window._status_font_size,
+        }
+    )
+    viewer.set_status_font_size.assert_called_once_with(main_window._status_font_size)
+    main_window._viewer_windows.clear()
+
+
+def test_switch_session_keeps_shared_log_rows(main_window) -> None:
+    """Test that a session switch only drops rows the new session lacks."""
+    providers = {}
+    for path in ("a.log", "b.log"):
+        main_window._add_log_to_list(path)
+        main_window._log_manager.register_log(path)
+        providers[path] = main_window._providers[path] = MagicMock()
+    kept_item = main_window._log_items["a.log"]
+
+    with (
+        patch.object(main_window._settings, "switch_session"),
+        patch.object(main_window._settings, "get_tracked_logs", return_value=["a.log"]),
+        patch.object(main_window, "_restore_log"),
+    ):
+        main_window._switch_to_session("other")
+
+    assert main_window._log_items == {"a.log": kept_item}
+    assert main_window.log_list.count() == 1
+    providers["b.log"].stop.assert_called_once()
+    providers["a.log"].stop.assert_not_called()
+    assert "b.log" not in main_window._providers
+    main_window._providers.clear()
+    main_window._pending_window_opens.clear()
+
+
+def test_switch_session_discards_windows_without_close_handlers(
+    qtbot, main_window
+) -> None:
+    """Test that windows of the old session are deleted silently on switch."""
+    main_window._add_log_to_list("a.log")
+    main_window._log_manager.register_log("a.log")
+    main_window._open_log_viewer("a.log")
+    old_viewer = main_window._viewer_windows["a.log"]
+
+    with (
+        patch.object(main_window._settings, "switch_session"),
+        patch.object(main_window._settings, "get_tracked_logs", return_value=[]),
+        patch.object(main_window, "_restore_log"),
+    ):
+        main_window._switch_to_session("other")
+
+    # A viewer for the same log in the new session must survive the old
+    # window's deferred deletion
+    new_viewer = MagicMock()
+    main_window._viewer_windows["a.log"] = new_viewer
+    main_window._viewer_list.append(new_viewer)
+
+    with patch.object(main_window, "_save_open_windows") as mock_save:
+        with qtbot.waitSignal(old_viewer.destroyed, timeout=2000):
+            pass
+        mock_save.assert_not_called()
+
+    assert main_window._viewer_windows["a.log"] is new_viewer
+    main_window._viewer_windows.clear()
+    main_window._viewer_list.clear()
+
+
+def test_stop_providers_only_signals_blocking_providers(main_window) -> None:
+    """Test that routine stops don't wait on providers stuck in blocking reads."""
+    file_provider = MagicMock(blocks_on_stop=False)
+    k8s_provider = MagicMock(blocks_on_stop=True)
+
+    main_window._stop_providers([file_provider, k8s_provider])
+
+    file_provider.stop.assert_called_once()
+    file_provider.wait.assert_called_once_with(5000)
+    k8s_provider.stop.assert_called_once()
+    k8s_provider.wait.assert_not_called()
+
+
+def test_kept_log_restarts_when_session_config_differs(main_window) -> None:
+    """Test that a kept log's provider follows the new session's config."""
+    path_key = "k8s://default/web"
+    old_provider = MagicMock(blocks_on_stop=True)
+    main_window._log_manager.register_log(path_key)
+    main_window._providers[path_key] = old_provider
+    main_window._provider_configs[path_key] = main_window._kubernetes_session_config(
+        path_key
+    )
+
+    with patch.object(main_window, "_start_provider") as mock_start:
+        # Same config: the running provider is kept
+        main_window._restore_log(path_key)
+        mock_start.assert_not_called()
+
+        # The new session points the log at another kubeconfig
+        with patch.object(
+            main_window._settings,
+            "get_provider_config",
+            return_value={"kubeconfig_path": "/other/config"},
+        ):
+            main_window._restore_log(path_key)
+
+    old_provider.stop.assert_called_once()
+    mock_start.assert_called_once()
+    assert mock_start.call_args[0][1].get("kubeconfig_path") == "/other/config"
+    main_window._providers.clear()
+    main_window._provider_configs.clear()
+
+
+def test_switch_session_repaints_before_chunked_restore(qtbot, main_window) -> None:
+    """Test that updates come back on before the queued logs are restored."""
+    tracked = [f"log{i}.log" for i in range(25)]
+    restored = []
+    list_updates = []
+
+    def restore(path_str: str) -> None:
+        restored.append(path_str)
+        list_updates.append(main_window.log_list.updatesEnabled())
+
+    with (
+        patch.object(main_window._settings, "switch_session"),
+        patch.object(main_window._settings, "get_tracked_logs", return_value=tracked),
+        patch.object(main_window, "_restore_log", side_effect=restore),
+    ):
+        main_window._switch_to_session("other")
+        assert main_window.updatesEnabled()
+        assert restored == []
+
+        qtbot.waitUntil(lambda: restored == tracked, timeout=2000)
+        assert not any(list_updates)
+        assert main_window.log_list.updatesEnabled()
+    main_window._pending_window_opens.clear()
@@ -1,6 +1,8 @@
 """Tests for the MCP bridge module."""
 
+import threading
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from logarithmic.log_manager import LogManager
 from logarithmic.mcp_bridge import McpBridge
@@ -97,7 +99,7 @@ def test_mcp_bridge_register_callback(mock_settings) -> None:
     # Set up metadata and subscribe
     settings.set_log_metadata("test.log", "log-001", "Test log")
     log_manager.register_log("test.log")
-    log_manager.subscribe("test.log", bridge)
+    bridge.subscribe_to_log("test.log")
 
     # Publish content
     log_manager.publish_content("test.log", "Test line\n")
@@ -233,3 +235,348 @@ def test_mcp_bridge_get_group_content_individual_logs(mock_settings) -> None:
     assert result["group_name"] == "GroupA"
     assert result["source"] == "individual_logs"
     assert "Test content" in result["content"]
+
+
+def test_mcp_bridge_content_accumulates_and_clears(mock_settings) -> None:
+    """Test that appended chunks read back joined and reset on clear."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+
+    log_manager.publish_content("test.log", "line 1\n")
+    log_manager.publish_content("test.log", "line 2\n")
+    assert bridge.get_log_content("test.log") == "line 1\nline 2\n"
+
+    log_manager.publish_content("test.log", "line 3\n")
+    assert bridge.get_log_content("test.log") == "line 1\nline 2\nline 3\n"
+
+    log_manager.clear_log("test.log")
+    assert bridge.get_log_content("test.log") == ""
+
+
+def test_mcp_bridge_cache_keeps_most_recent_lines(mock_settings) -> None:
+    """Test that the per-log cache is capped at the configured line count."""
+    log_manager = LogManager()
+    settings = Settings()
+    settings._data["mcp_server"]["max_cached_lines"] = 3
+    bridge = McpBridge(log_manager, settings)
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+
+    log_manager.publish_content("test.log", "1\n2\n3\n")
+    log_manager.publish_content("test.log", "4\n5\n")
+
+    assert bridge.get_log_content("test.log") == "3\n4\n5\n"
+
+
+def test_mcp_bridge_get_all_logs(mock_settings) -> None:
+    """Test that all logs report metadata, falling back to the path key."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+
+    settings.set_log_metadata("a.log", "log-a", "Log A")
+    for path in ("a.log", "b.log"):
+        log_manager.register_log(path)
+        bridge.subscribe_to_log(path)
+    log_manager.publish_content("a.log", "hello\n")
+
+    logs = bridge.get_all_logs()
+
+    assert logs["a.log"] == {
+        "id": "log-a",
+        "description": "Log A",
+        "content": "hello\n",
+        "path": "a.log",
+    }
+    assert logs["b.log"]["id"] == "b.log"
+    assert logs["b.log"]["content"] == ""
+
+
+def test_mcp_bridge_get_log_info_follows_metadata_changes(mock_settings) -> None:
+    """Test that ID lookups see metadata set after the first query."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+
+    settings.set_log_metadata("test.log", "log-001", "Test log")
+    assert bridge.get_log_info("log-001")["path"] == "test.log"
+
+    settings.set_log_metadata("test.log", "log-002", "Renamed")
+    assert bridge.get_log_info("log-001") is None
+    info = bridge.get_log_info("log-002")
+    assert info["description"] == "Renamed"
+
+    settings.remove_log_metadata("test.log")
+    assert bridge.get_log_info("log-002") is None
+
+
+def test_mcp_bridge_unregister_callback(mock_settings) -> None:
+    """Test that an unregistered callback stops receiving updates."""
+    log_manager = LogManager()
+    bridge = McpBridge(log_manager, Settings())
+    kept = MagicMock()
+    removed = MagicMock()
+
+    bridge.register_update_callback(kept)
+    bridge.register_update_callback(removed)
+    bridge.register_update_callback(kept)
+    bridge.unregister_update_callback(removed)
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+    log_manager.publish_content("test.log", "line\n")
+
+    kept.assert_called_once_with("test.log", "line\n")
+    removed.assert_not_called()
+
+
+def test_mcp_bridge_concurrent_subscribe_subscribes_once(mock_settings) -> None:
+    """Test that racing subscribe calls register with the log manager once."""
+    log_manager = MagicMock()
+    bridge = McpBridge(log_manager, Settings())
+    barrier = threading.Barrier(8)
+
+    def subscribe() -> None:
+        barrier.wait()
+        bridge.subscribe_to_log("test.log")
+
+    threads = [threading.Thread(target=subscribe) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    log_manager.subscribe.assert_called_once_with("test.log", bridge)
+
+
+def test_mcp_bridge_ignores_content_after_unsubscribe(mock_settings) -> None:
+    """Test that late content for an unsubscribed log is dropped."""
+    log_manager = LogManager()
+    bridge = McpBridge(log_manager, Settings())
+    callback = MagicMock()
+    bridge.register_update_callback(callback)
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+    bridge.unsubscribe_from_log("test.log")
+
+    # Delivered by a provider thread that raced the unsubscribe
+    bridge.on_log_content("test.log", "late\n")
+
+    assert "test.log" not in bridge._log_cache
+    callback.assert_not_called()
+
+
+def test_mcp_bridge_subscribe_receives_buffered_content(mock_settings) -> None:
+    """Test that the buffer replay on subscribe re-enters the bridge safely."""
+    log_manager = LogManager()
+    bridge = McpBridge(log_manager, Settings())
+
+    log_manager.register_log("test.log")
+    log_manager.publish_content("test.log", "before\n")
+    bridge.subscribe_to_log("test.log")
+
+    assert bridge.get_log_content("test.log") == "before\n"
+
+
+def test_mcp_bridge_joins_lines_split_across_chunks(mock_settings) -> None:
+    """Test that partial lines are completed and counted once."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_metadata("test.log", "log-001", "Test log")
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+    for chunk in ("Line 1\nLi", "ne 2\nLine", " 3\n", "Line 4"):
+        log_manager.publish_content("test.log", chunk)
+
+    assert bridge.get_log_content("test.log") == "Line 1\nLine 2\nLine 3\nLine 4"
+    assert bridge.get_last_n_lines("log-001", 2) == "Line 3\nLine 4"
+    assert bridge.get_last_n_lines("log-001", 10).startswith("Line 1\n")
+
+
+def test_mcp_bridge_get_group_content_checks_only_that_group(mock_settings) -> None:
+    """Test that group content does not probe other groups' combined views."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_groups({"a.log": "GroupA", "b.log": "GroupB"})
+
+    with patch.object(bridge, "_combined_controller", return_value=None) as lookup:
+        result = bridge.get_group_content("GroupA")
+
+    lookup.assert_called_once_with("GroupA")
+    assert result["source"] == "individual_logs"
+    assert result["log_count"] == 1
+
+
+def test_mcp_bridge_subscribe_to_all_tracked_logs(mock_settings) -> None:
+    """Test that tracked logs are subscribed in one batch, skipping known ones."""
+    log_manager = LogManager()
+    settings = Settings()
+    settings.set_tracked_logs(["a.log", "b.log"])
+    bridge = McpBridge(log_manager, settings)
+    for path in ("a.log", "b.log"):
+        log_manager.register_log(path)
+    log_manager.publish_content("b.log", "buffered\n")
+    bridge.subscribe_to_log("a.log")
+
+    with patch.object(
+        log_manager, "subscribe_many", wraps=log_manager.subscribe_many
+    ) as mock_many:
+        bridge.subscribe_to_all_tracked_logs()
+
+    mock_many.assert_called_once_with(["b.log"], bridge)
+    assert bridge.get_log_content("b.log") == "buffered\n"
+    assert bridge._subscribed_paths == {"a.log", "b.log"}
+
+
+def test_mcp_bridge_get_all_logs_reuses_fields(mock_settings) -> None:
+    """Test that repeated polls reuse the metadata fields until they change."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_metadata("a.log", "log-a", "Log A")
+    log_manager.register_log("a.log")
+    bridge.subscribe_to_log("a.log")
+
+    def read_metadata() -> dict:
+        # Metadata is read after the content snapshot releases the lock
+        assert not bridge._lock.locked()
+        return get_all_log_metadata()
+
+    get_all_log_metadata = settings.get_all_log_metadata
+    with patch.object(
+        settings, "get_all_log_metadata", side_effect=read_metadata
+    ) as mock_get:
+        first = bridge.get_all_logs()
+        second = bridge.get_all_logs()
+        assert mock_get.call_count == 1
+
+    assert first == second
+    assert first["a.log"] is not second["a.log"]
+
+    settings.set_log_metadata("a.log", "log-a", "Renamed")
+    assert bridge.get_all_logs()["a.log"]["description"] == "Renamed"
+
+
+def test_mcp_bridge_get_group_content_tails_each_log(mock_settings) -> None:
+    """Test that the individual-log fallback tails every subscribed log."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_groups({"a.log": "G", "b.log": "G", "c.log": "G"})
+    settings.set_log_metadata("a.log", "log-a", "Log A")
+
+    for path in ("a.log", "b.log"):
+        log_manager.register_log(path)
+        bridge.subscribe_to_log(path)
+    log_manager.publish_content("a.log", "a1\na2\na3\n")
+    log_manager.publish_content("b.log", "b1\nb2\n")
+
+    result = bridge.get_group_content("G", num_lines=1)
+
+    assert result["content"] == "=== Log A ===\na3\n\n\n=== b.log ===\nb2\n"
+    assert result["log_count"] == 3
+
+
+def test_mcp_bridge_only_newline_ends_a_line(mock_settings) -> None:
+    """Test that lone separators other than newline don't end cached lines."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_metadata("test.log", "log-001", "Test log")
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+    for chunk in ("one\rstill one\x0c", "more\n", "two\n"):
+        log_manager.publish_content("test.log", chunk)
+
+    assert bridge.get_last_n_lines("log-001", 1) == "two\n"
+    assert bridge.get_last_n_lines("log-001", 2) == "one\rstill one\x0cmore\ntwo\n"
+
+
+def test_mcp_bridge_crlf_split_across_chunks(mock_settings) -> None:
+    """Test that a CRLF pair split between chunks forms a single line."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_metadata("test.log", "log-001", "Test log")
+
+    log_manager.register_log("test.log")
+    bridge.subscribe_to_log("test.log")
+    for chunk in ("first\r", "\nsecond\r\n"):
+        log_manager.publish_content("test.log", chunk)
+
+    assert list(bridge._log_cache["test.log"]) == ["first\r\n", "second\r\n"]
+    assert bridge.get_last_n_lines("log-001", 1) == "second\r\n"
+
+
+def test_mcp_bridge_id_lookup_reads_settings_outside_lock(mock_settings) -> None:
+    """Test that rebuilding the ID index doesn't hold the bridge lock."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_metadata("a.log", "log-a", "Log A")
+    log_manager.register_log("a.log")
+    bridge.subscribe_to_log("a.log")
+    log_manager.publish_content("a.log", "one\ntwo\n")
+
+    get_all_log_metadata = settings.get_all_log_metadata
+
+    def read_metadata() -> dict:
+        assert not bridge._lock.locked()
+        return get_all_log_metadata()
+
+    with patch.object(settings, "get_all_log_metadata", side_effect=read_metadata):
+        assert bridge.get_last_n_lines("log-a", 1) == "two\n"
+        assert bridge.get_log_info("log-a")["description"] == "Log A"
+
+
+def test_mcp_bridge_readers_never_read_metadata_under_lock(mock_settings) -> None:
+    """Test that no reader consults settings metadata with the lock held."""
+    log_manager = LogManager()
+    settings = Settings()
+    bridge = McpBridge(log_manager, settings)
+    settings.set_log_metadata("a.log", "log-a", "Log A")
+    settings.set_log_groups({"a.log": "G"})
+    log_manager.register_log("a.log")
+    bridge.subscribe_to_log("a.log")
+    log_manager.publish_content("a.log", "line\n")
+
+    def unlocked(getter):
+        def read(*args):
+            assert not bridge._lock.locked()
+            return getter(*args)
+
+        return read
+
+    with (
+        patch.object(
+            settings,
+            "get_all_log_metadata",
+            side_effect=unlocked(settings.get_all_log_metadata),
+        ),
+        patch.object(
+            settings,
+            "get_log_metadata",
+            side_effect=unlocked(settings.get_log_metadata),
+        ),
+        patch.object(
+            settings,
+            "get_log_metadata_revision",
+            side_effect=unlocked(settings.get_log_metadata_revision),
+        ),
+    ):
+        assert bridge.get_all_logs()["a.log"]["id"] == "log-a"
+        assert bridge.get_log_info("log-a")["content"] == "line\n"
+        assert "=== Log A ===" in bridge.get_group_content("G", 5)["content"]
@@ -1,6 +1,8 @@
 """Tests for the settings module."""
 
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 from logarithmic.settings import Settings
 
@@ -55,6 +57,19 @@ def test_window_position(mock_settings: Path) -> None:
     assert position["height"] == 600
 
 
+def test_open_windows_unchanged_skips_save(mock_settings: Path) -> None:
+    """Test that saving an unchanged open windows list does not hit disk."""
+    settings = Settings()
+    settings.set_open_windows(["/path/to/log.log"])
+
+    with patch.object(settings, "_save") as mock_save:
+        settings.set_open_windows(["/path/to/log.log"])
+        mock_save.assert_not_called()
+
+        settings.set_open_windows([])
+        mock_save.assert_called_once()
+
+
 def test_session_management(mock_settings: Path) -> None:
     """Test session creation and switching."""
     settings = Settings()
@@ -144,3 +159,32 @@ def test_group_mode_multiple_groups(mock_settings: Path) -> None:
 
     assert settings.get_group_mode("Group1") == "tabbed"
     assert settings.get_group_mode("Group2") == "combined"
+
+
+def test_writes_reach_disk_after_flush(mock_settings: Path) -> None:
+    """Test that background session writes land on disk once flushed."""
+    settings = Settings()
+    for i in range(5):
+        settings.set_default_window_size(100 + i, 200)
+    settings.flush()
+
+    session_file = settings.sessions_dir / "default.json"
+    data = json.loads(session_file.read_text(encoding="utf-8"))
+    assert data["default_window_width"] == 104
+    assert Settings().get_default_window_size() == (104, 200)
+
+
+def test_unchanged_save_is_skipped(mock_settings: Path) -> None:
+    """Test that saving identical data does not queue another write."""
+    settings = Settings()
+    settings.set_default_window_size(640, 480)
+    settings.flush()
+
+    with patch.object(settings, "_write_pending") as mock_write:
+        settings.save()
+        settings.set_default_window_size(640, 480)
+        mock_write.assert_not_called()
+
+        settings.set_default_window_size(800, 600)
+        settings.flush()
+        mock_write.assert_called_once()